@@ -0,0 +1,42 @@
+"""Normalize windows-style paths in the ``.coverage`` sqlite database to unix-style ones.
+
+Ran in CI after collecting coverage, so that coverage reporting tools see consistent
+relative paths, regardless of the OS the tests ran on.
+"""
+
+import sqlite3
+
+connection = sqlite3.connect(".coverage")
+
+# The coverage database is an ephemeral CI artifact, so durability is irrelevant here.
+# Skip journaling and fsyncs, which would otherwise dominate the wall time of the
+# rewrite below (notably on windows runners).
+connection.executescript(
+    "PRAGMA journal_mode=MEMORY;"
+    "PRAGMA synchronous=OFF;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA locking_mode=EXCLUSIVE;"
+)
+
+# Normalization rules as (pattern, replacement) pairs. All rules are composed into
+# a single UPDATE statement, so adding one here costs neither an extra table scan
+# nor an extra transaction.
+RULES = [
+    ("\\", "/"),
+]
+
+path_expr = "path"
+where_parts = []
+params: list[str] = []
+for pattern, replacement in RULES:
+    path_expr = f"REPLACE({path_expr}, ?, ?)"
+    where_parts.append("instr(path, ?) > 0")
+    params.extend((pattern, replacement))
+params.extend(pattern for pattern, _ in RULES)
+
+connection.execute("BEGIN IMMEDIATE")
+# Filter on instr so rows no rule applies to (i.e. everything on posix runners)
+# aren't rewritten at all, avoiding a full-table write for a no-op change.
+connection.execute(f"UPDATE file SET path = {path_expr} WHERE {' OR '.join(where_parts)}", params)  # noqa: S608
+connection.commit()
+connection.close()
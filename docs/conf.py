@@ -10,6 +10,7 @@ https://www.sphinx-doc.org/en/master/usage/configuration.html
 from __future__ import annotations
 
 import datetime
+import pickle
 import sys
 from pathlib import Path
 
@@ -24,8 +25,46 @@ else:
 
 # -- Basic project information -----------------------------------------------
 
-with Path("../pyproject.toml").open("rb") as f:
-    pkg_meta: dict[str, str] = toml_parse(f)["tool"]["poetry"]
+PYPROJECT_PATH = Path("../pyproject.toml")
+PYPROJECT_CACHE_PATH = Path("_build/.pyproject_cache.pkl")
+
+
+def _load_pkg_meta() -> dict[str, str]:
+    """Load the ``[tool.poetry]`` table from pyproject.toml, with an on-disk cache.
+
+    Docs get rebuilt a lot (e.g. with sphinx-autobuild), and re-parsing the TOML file on
+    every rebuild is wasted work, especially on python <3.11, where the pure-python
+    ``tomli`` parser is used. To avoid it, the parsed table is pickled alongside the
+    build output, keyed by the pyproject.toml mtime and size, and only re-parsed when
+    the file actually changes.
+    """
+    stat = PYPROJECT_PATH.stat()
+    cache_key = (stat.st_mtime, stat.st_size)
+
+    try:
+        with PYPROJECT_CACHE_PATH.open("rb") as f:
+            # The pickle was written by this very script, it's not untrusted input
+            cached_mtime, cached_size, cached_meta = pickle.load(f)  # noqa: S301
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+    else:
+        if (cached_mtime, cached_size) == cache_key:
+            return cached_meta
+
+    with PYPROJECT_PATH.open("rb") as f:
+        meta: dict[str, str] = toml_parse(f)["tool"]["poetry"]
+
+    try:
+        PYPROJECT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with PYPROJECT_CACHE_PATH.open("wb") as f:
+            pickle.dump((*cache_key, meta), f)
+    except OSError:
+        pass  # a cold cache on the next run is not worth failing the build over
+
+    return meta
+
+
+pkg_meta: dict[str, str] = _load_pkg_meta()
 
 project = str(pkg_meta["name"])
 copyright = f"{datetime.datetime.now(tz=datetime.timezone.utc).date().year}, ItsDrike"  # noqa: A001
@@ -200,6 +239,10 @@ def override_towncrier_draft_format() -> None:
 
     orig_f = sphinxcontrib.towncrier.ext._nodes_from_document_markup_source  # pyright: ignore[reportPrivateUsage]
 
+    # Constructed once here; M2R compiles its regex patterns on construction, so
+    # rebuilding it for every draft source would redo that work each time.
+    m2r_converter = m2r2.M2R()
+
     def override_f(
         state: statemachine.State,  # pyright: ignore[reportMissingTypeArgument] # arg not specified in orig_f either
         markup_source: str,
@@ -212,12 +255,19 @@ def override_towncrier_draft_format() -> None:
             markup_source = markup_source[:-3]
 
         markup_source = markup_source.rstrip(" \n")
-        markup_source = m2r2.M2R()(markup_source)
+        markup_source = m2r_converter(markup_source)
 
         return orig_f(state, markup_source)
 
     sphinxcontrib.towncrier.ext._nodes_from_document_markup_source = override_f  # pyright: ignore[reportPrivateUsage]
 
 
-mock_autodoc()
-override_towncrier_draft_format()
+def setup(app: object) -> None:
+    """Apply our monkeypatches once sphinx actually initializes the build.
+
+    Running these from here rather than at conf.py import time means the heavy imports
+    they pull in (sphinx.ext.autodoc, m2r2, sphinxcontrib.towncrier) are only paid for
+    by real builds, not by anything else that merely imports this configuration.
+    """
+    mock_autodoc()
+    override_towncrier_draft_format()
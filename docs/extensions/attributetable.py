@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import inspect
 import re
 from collections.abc import Sequence
+from operator import attrgetter
 from typing import Any, ClassVar, NamedTuple
 
 from docutils import nodes
@@ -55,11 +57,9 @@ def visit_attributetabletitle_node(self: HTML5Translator, node: AttributeTableTi
 
 
 def visit_attributetablebadge_node(self: HTML5Translator, node: AttributeTableBadge) -> None:
-    attributes = {
-        "class": "py-attribute-table-badge",
-        "title": node["badge-type"],
-    }
-    self.body.append(self.starttag(node, "span", **attributes))
+    # The badge types are fixed single words, so the whole tag can be emitted as one
+    # f-string, rather than going through starttag's generic kwargs handling.
+    self.body.append(f'<span class="py-attribute-table-badge" title="{node["badge-type"]}">')
 
 
 def visit_attributetable_item_node(self: HTML5Translator, node: AttributeTableItem) -> None:
@@ -88,6 +88,23 @@ def depart_attributetable_item_node(self: HTML5Translator, node: AttributeTableI
 
 _name_parser_regex = re.compile(r"(?P<module>[\w.]+\.)?(?P<name>\w+)")
 
+# Object types that never show up as class members in the tables
+IGNORED_OBJTYPES = frozenset({"data", "exception", "module", "class"})
+
+# Doc prefixes used to classify attributes in get_class_results, hoisted so the
+# tuple isn't rebuilt per attribute
+CORO_DOC_PREFIX = "|coro|"
+DECORATOR_DOC_PREFIXES = ("A decorator", "A shortcut decorator")
+
+# Translated once here instead of per attribute in get_class_results
+ATTRIBUTES_LABEL = translate("Attributes")
+METHODS_LABEL = translate("Methods")
+COROUTINE_BADGE = translate("coroutine")
+CLASSMETHOD_BADGE = translate("classmethod")
+DECORATOR_BADGE = translate("decorator")
+ASYNC_ITERABLE_BADGE = translate("async iterable")
+METHOD_BADGE = translate("method")
+
 
 class PyAttributeTable(SphinxDirective):
     has_content: ClassVar[bool] = False
@@ -97,10 +114,16 @@ class PyAttributeTable(SphinxDirective):
     option_spec: ClassVar[OptionSpec | None] = {}
 
     def parse_name(self, content: str) -> tuple[str, str]:
-        match = _name_parser_regex.match(content)
-        if match is None:
-            raise RuntimeError(f"content {content} somehow doesn't match regex in {self.env.docname}.")
-        path, name = match.groups()
+        # A plain rpartition covers the common "module.path.ClassName" / "ClassName"
+        # forms without the regex machinery; the regex is only kept as a fallback
+        # (and validator) for anything it doesn't split cleanly.
+        path, _, name = content.rpartition(".")
+        if not name:
+            match = _name_parser_regex.fullmatch(content)
+            if match is None:
+                raise RuntimeError(f"content {content} somehow doesn't match regex in {self.env.docname}.")
+            path, name = match.groups()
+            path = path or ""
         if path:
             modulename = path.rstrip(".")
         else:
@@ -143,6 +166,9 @@ class PyAttributeTable(SphinxDirective):
         content = self.arguments[0].strip()
         node = AttributeTablePlaceholder("")
         modulename, name = self.parse_name(content)
+        # Mark the document, so process_attributetable can skip traversing doctrees
+        # that don't contain any attributetable directives at all.
+        self.env.metadata.setdefault(self.env.docname, {})["has_attributetable"] = True
         node["python-doc"] = self.env.docname
         node["python-module"] = modulename
         node["python-class"] = name
@@ -150,28 +176,38 @@ class PyAttributeTable(SphinxDirective):
         return [node]
 
 
+def get_lookup_table(env: BuildEnvironment) -> dict[str, list[str]]:
+    """Obtain the class-name lookup table, rebuilding it only when the py domain changed.
+
+    ``process_attributetable`` runs once per document, but the lookup table it needs is
+    identical for every document in the build, making recomputing it O(docs x py-objects).
+    The table is instead cached on the build environment, invalidated whenever the number
+    of objects in the py domain changes.
+    """
+    domain = env.domains["py"]
+    key = len(domain.objects)
+
+    cached: tuple[int, dict[str, list[str]]] | None = getattr(env, "_attributetable_lookup_cache", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    table = build_lookup_table(env)
+    env._attributetable_lookup_cache = (key, table)  # pyright: ignore[reportAttributeAccessIssue]
+    return table
+
+
 def build_lookup_table(env: BuildEnvironment) -> dict[str, list[str]]:
     # Given an environment, load up a lookup table of
     # full-class-name: objects
-    result = {}
+    result: dict[str, list[str]] = {}
     domain = env.domains["py"]
 
-    ignored = {
-        "data",
-        "exception",
-        "module",
-        "class",
-    }
-
     for fullname, _, objtype, _, _, _ in domain.get_objects():
-        if objtype in ignored:
+        if objtype in IGNORED_OBJTYPES:
             continue
 
         classname, _, child = fullname.rpartition(".")
-        try:
-            result[classname].append(child)
-        except KeyError:
-            result[classname] = [child]
+        result.setdefault(classname, []).append(child)
 
     return result
 
@@ -185,15 +221,18 @@ class TableElement(NamedTuple):
 def process_attributetable(app: Sphinx, doctree: nodes.Node, fromdocname: str) -> None:
     env = app.builder.env
 
-    lookup = build_lookup_table(env)
-    for node in doctree.traverse(AttributeTablePlaceholder):
+    if not env.metadata.get(fromdocname, {}).get("has_attributetable"):
+        return
+
+    lookup = get_lookup_table(env)
+    for node in doctree.findall(AttributeTablePlaceholder):
         modulename, classname, fullname = node["python-module"], node["python-class"], node["python-full-name"]
         groups = get_class_results(lookup, modulename, classname, fullname)
         table = AttributeTable("")
         for label, subitems in groups.items():
             if not subitems:
                 continue
-            table.append(class_results_to_node(label, sorted(subitems, key=lambda c: c.label)))
+            table.append(class_results_to_node(label, sorted(subitems, key=attrgetter("label"))))
 
         table["python-class"] = fullname
 
@@ -203,15 +242,25 @@ def process_attributetable(app: Sphinx, doctree: nodes.Node, fromdocname: str) -
             node.replace_self([table])
 
 
+@functools.cache
+def _resolve_class(modulename: str, name: str) -> type:
+    """Resolve a class from its module path, memoized across placeholders.
+
+    sys.modules already caches the module itself, but the dotted-name resolution and
+    import-lock handling in import_module still run per call; the cache skips that
+    entirely for repeated classes across documents.
+    """
+    return getattr(importlib.import_module(modulename), name)
+
+
 def get_class_results(
     lookup: dict[str, list[str]], modulename: str, name: str, fullname: str
 ) -> dict[str, list[TableElement]]:
-    module = importlib.import_module(modulename)
-    cls = getattr(module, name)
+    cls = _resolve_class(modulename, name)
 
     groups: dict[str, list[TableElement]] = {
-        translate("Attributes"): [],
-        translate("Methods"): [],
+        ATTRIBUTES_LABEL: [],
+        METHODS_LABEL: [],
     }
 
     try:
@@ -219,43 +268,49 @@ def get_class_results(
     except KeyError:
         return groups
 
+    # Merge the MRO dicts once (least-specific first, so more specific bases win),
+    # rather than walking the full MRO for every single attribute.
+    resolved: dict[str, Any] = {}
+    for base in reversed(cls.__mro__):
+        resolved.update(base.__dict__)
+
     for attr in members:
         attrlookup = f"{fullname}.{attr}"
-        key = translate("Attributes")
+        key = ATTRIBUTES_LABEL
         badge = None
         label = attr
-        value = None
 
-        for base in cls.__mro__:
-            value = base.__dict__.get(attr)
-            if value is not None:
-                break
+        value = resolved.get(attr)
 
         if value is not None:
             doc = value.__doc__ or ""
-            if inspect.iscoroutinefunction(value) or doc.startswith("|coro|"):
-                key = translate("Methods")
+            # Note: async functions share their concrete type with plain ones, so a pure
+            # type-keyed dispatch can't be used here; classification keeps its order, with
+            # the classmethod case narrowed to an exact type check (classmethod is final
+            # enough for our purposes, and `type() is` skips the isinstance protocol).
+            if inspect.iscoroutinefunction(value) or doc.startswith(CORO_DOC_PREFIX):
+                key = METHODS_LABEL
                 badge = AttributeTableBadge("async", "async")
-                badge["badge-type"] = translate("coroutine")
-            elif isinstance(value, classmethod):
-                key = translate("Methods")
+                badge["badge-type"] = COROUTINE_BADGE
+            elif type(value) is classmethod:
+                key = METHODS_LABEL
                 label = f"{name}.{attr}"
                 badge = AttributeTableBadge("cls", "cls")
-                badge["badge-type"] = translate("classmethod")
+                badge["badge-type"] = CLASSMETHOD_BADGE
             elif inspect.isfunction(value):
-                if doc.startswith(("A decorator", "A shortcut decorator")):
+                if doc.startswith(DECORATOR_DOC_PREFIXES):
                     # finicky but surprisingly consistent
-                    key = translate("Methods")
+                    key = METHODS_LABEL
                     badge = AttributeTableBadge("@", "@")
-                    badge["badge-type"] = translate("decorator")
+                    badge["badge-type"] = DECORATOR_BADGE
                 elif inspect.isasyncgenfunction(value):
-                    key = translate("Methods")
+                    key = METHODS_LABEL
                     badge = AttributeTableBadge("async for", "async for")
-                    badge["badge-type"] = translate("async iterable")
+                    badge["badge-type"] = ASYNC_ITERABLE_BADGE
                 else:
-                    key = translate("Methods")
+                    key = METHODS_LABEL
                     badge = AttributeTableBadge("def", "def")
-                    badge["badge-type"] = translate("method")
+                    badge["badge-type"] = METHOD_BADGE
 
         groups[key].append(TableElement(fullname=attrlookup, label=label, badge=badge))
 
@@ -264,7 +319,7 @@ def get_class_results(
 
 def class_results_to_node(key: str, elements: Sequence[TableElement]) -> AttributeTableColumn:
     title = AttributeTableTitle(key, key)
-    ul = nodes.bullet_list("")
+    items: list[AttributeTableItem] = []
     for element in elements:
         ref = nodes.reference(
             "",
@@ -276,10 +331,12 @@ def class_results_to_node(key: str, elements: Sequence[TableElement]) -> Attribu
         )
         para = addnodes.compact_paragraph("", "", ref)
         if element.badge is not None:
-            ul.append(AttributeTableItem("", element.badge, para))
+            items.append(AttributeTableItem("", element.badge, para))
         else:
-            ul.append(AttributeTableItem("", para))
+            items.append(AttributeTableItem("", para))
 
+    ul = nodes.bullet_list("")
+    ul.extend(items)
     return AttributeTableColumn("", title, ul)
 
 
@@ -292,4 +349,7 @@ def setup(app: Sphinx) -> dict[str, Any]:
     app.add_node(AttributeTableItem, html=(visit_attributetable_item_node, depart_attributetable_item_node))
     app.add_node(AttributeTablePlaceholder)
     _ = app.connect("doctree-resolved", process_attributetable)
-    return {"parallel_read_safe": True}
+    # Writing only appends to the translator's own body, and both caches involved
+    # (the env lookup table and the class-resolution lru_cache) are rebuilt lazily
+    # per worker process, so parallel writes are safe.
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -1 +1,56 @@
 from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # These are listed in __all__, but at runtime they're resolved lazily by the
+    # module __getattr__ below, not by these imports
+    from mcproto.auth.account import Account, InvalidAccountAccessTokenError, MismatchedAccountInfoError  # noqa: TC004
+    from mcproto.auth.msa import MSAAccount, ServicesAPIError, ServicesAPIErrorType, full_msa_login  # noqa: TC004
+    from mcproto.auth.yggdrasil import AuthServerApiError, AuthServerApiErrorType, YggdrasilAccount  # noqa: TC004
+
+__all__ = [
+    "Account",
+    "AuthServerApiError",
+    "AuthServerApiErrorType",
+    "InvalidAccountAccessTokenError",
+    "MSAAccount",
+    "MismatchedAccountInfoError",
+    "ServicesAPIError",
+    "ServicesAPIErrorType",
+    "YggdrasilAccount",
+    "full_msa_login",
+]
+
+# Submodule holding each re-exported name. The names are resolved lazily (PEP 562),
+# so that merely importing mcproto.auth doesn't execute every auth submodule; the
+# error Enum classes in particular allocate descriptor objects per member at class
+# creation time, which is pure waste for users that never touch that auth system.
+_EXPORT_MODULE_MAP = {
+    "Account": "account",
+    "InvalidAccountAccessTokenError": "account",
+    "MismatchedAccountInfoError": "account",
+    "MSAAccount": "msa",
+    "ServicesAPIError": "msa",
+    "ServicesAPIErrorType": "msa",
+    "full_msa_login": "msa",
+    "AuthServerApiError": "yggdrasil",
+    "AuthServerApiErrorType": "yggdrasil",
+    "YggdrasilAccount": "yggdrasil",
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module_name = _EXPORT_MODULE_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache the resolved name in the module's globals, so __getattr__ is only hit once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,70 @@
+"""Shared HTTP client for the authentication flows.
+
+A full login runs a chain of requests against several hosts (Microsoft OAuth2 ->
+Xbox Live -> XSTS -> Minecraft services). Constructing a fresh ``httpx.AsyncClient``
+for each call means paying a TCP + TLS handshake on every hop of that chain, so all
+of the auth coroutines fall back to one shared, connection-pooling client whenever
+the caller doesn't pass their own. For the same reason, callers that do bring their
+own client should keep a single one alive across the entire login sequence.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+__all__ = [
+    "close_auth_client",
+    "get_auth_client",
+]
+
+# The shared client, keyed by the event loop it was created under. The client's
+# connection pool binds to the running loop once used, so a client left over from a
+# previous (e.g. already finished asyncio.run()) loop can't be reused and has to be
+# replaced; see get_auth_client. Only the current loop's client is kept.
+_CLIENT_CACHE: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _new_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    timeout = httpx.Timeout(30)
+    try:
+        # HTTP/2 lets concurrent requests against the same host multiplex over
+        # a single connection, but it needs the optional h2 dependency.
+        return httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+    except ImportError:
+        return httpx.AsyncClient(limits=limits, timeout=timeout)
+
+
+def get_auth_client() -> httpx.AsyncClient:
+    """Obtain the shared HTTP client used as the fallback by the auth coroutines.
+
+    The client is created lazily on first use, and stays alive as long as the current
+    event loop (or until :func:`close_auth_client` is called). A client created under
+    an earlier, since closed event loop is dropped and replaced, so separate
+    ``asyncio.run()`` calls each get a working client rather than "Event loop is
+    closed" errors from the stale connection pool.
+    """
+    loop = asyncio.get_running_loop()
+    client = _CLIENT_CACHE.get(loop)
+    if client is None:
+        # Any cached client belongs to another loop; it can't even be closed
+        # cleanly from here (aclose has to run on its own loop), so just drop it
+        # and let the garbage collector reclaim its connections.
+        _CLIENT_CACHE.clear()
+        client = _CLIENT_CACHE[loop] = _new_client()
+    return client
+
+
+async def close_auth_client() -> None:
+    """Close the shared HTTP client, if one was ever created.
+
+    If the client was created under a different event loop than the current one,
+    it's only dropped (closing it has to happen on its own loop, which is
+    presumably gone).
+    """
+    client = _CLIENT_CACHE.pop(asyncio.get_running_loop(), None)
+    _CLIENT_CACHE.clear()
+    if client is not None:
+        await client.aclose()
@@ -0,0 +1,41 @@
+"""JSON (de)serialization helpers for the authentication modules.
+
+The API payloads here are small, but logins chain several requests (and error bodies
+can get verbose), so when the optional C-accelerated ``orjson`` library is importable,
+it is used for both decoding responses and encoding request bodies, falling back to
+httpx's stdlib-json handling otherwise.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = [
+    "json_request_kwargs",
+    "response_json",
+]
+
+
+def response_json(response: httpx.Response) -> Any:  # JSON can hold any type
+    """Decode the JSON body of ``response``."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def json_request_kwargs(payload: object) -> dict[str, Any]:
+    """Produce keyword arguments for an httpx request, sending ``payload`` as its JSON body.
+
+    With orjson available, the payload is pre-encoded to bytes and passed as ``content``
+    (with an explicit content-type header), skipping httpx's stdlib-json encoding path.
+    """
+    if orjson is not None:
+        return {"content": orjson.dumps(payload), "headers": {"content-type": "application/json"}}
+    return {"json": payload}
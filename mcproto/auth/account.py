@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable
+
 import httpx
 from typing_extensions import override
 
+from mcproto.auth._json import response_json
 from mcproto.types.uuid import UUID as McUUID  # noqa: N811
 
 MINECRAFT_API_URL = "https://api.minecraftservices.com"
 
+# Endpoint URL, built once instead of per call
+_PROFILE_URL = f"{MINECRAFT_API_URL}/minecraft/profile"
+
 __all__ = [
     "Account",
     "InvalidAccountAccessTokenError",
@@ -43,25 +50,53 @@ class InvalidAccountAccessTokenError(Exception):
 class Account:
     """Base class for an authenticated Minecraft account."""
 
-    __slots__ = ("access_token", "username", "uuid")
+    __slots__ = ("_access_token", "_auth_header", "username", "uuid")
 
     def __init__(self, username: str, uuid: McUUID, access_token: str) -> None:
         self.username = username
         self.uuid = uuid
         self.access_token = access_token
 
+    @property
+    def access_token(self) -> str:
+        """The access token used to authenticate API requests on behalf of this account."""
+        return self._access_token
+
+    @access_token.setter
+    def access_token(self, value: str) -> None:
+        self._access_token = value
+        self._auth_header = {"Authorization": f"Bearer {value}"}
+
+    @property
+    def auth_header(self) -> dict[str, str]:
+        """The Authorization header used for API requests on behalf of this account.
+
+        The header dict is (re)built whenever :attr:`access_token` is assigned and reused,
+        rather than being reconstructed for each request.
+        """
+        return self._auth_header
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        # A subclass without its own __slots__ silently reintroduces __dict__,
+        # throwing away the per-instance memory savings slots give us here.
+        if "__slots__" not in cls.__dict__:
+            raise TypeError(f"{cls.__name__} must define __slots__ (Account subclasses are expected to be slotted)")
+
     async def check(self, client: httpx.AsyncClient) -> None:
         """Check with minecraft API whether the account information stored is valid.
 
+        When checking many accounts at once, it pays off to construct the ``client``
+        with connection reuse and HTTP/2 multiplexing enabled, i.e.
+        ``httpx.AsyncClient(http2=True, limits=httpx.Limits(max_keepalive_connections=32))``,
+        so that concurrent checks share connections instead of each paying for a TLS handshake.
+
         :raises MismatchedAccountInfoError:
             If the information received from the minecraft API didn't match the information currently
             stored in the account instance.
         :raises InvalidAccountAccessTokenError: If the access token is not valid.
         """
-        res = await client.get(
-            f"{MINECRAFT_API_URL}/minecraft/profile",
-            headers={"Authorization": f"Bearer {self.access_token}"},
-        )
+        res = await client.get(_PROFILE_URL, headers=self._auth_header)
 
         try:
             res.raise_for_status()
@@ -69,9 +104,39 @@ class Account:
             if exc.response.status_code == 401:
                 raise InvalidAccountAccessTokenError(self.access_token, exc) from exc
             raise
-        data = res.json()
+        data = response_json(res)
 
-        if self.uuid != McUUID(data["id"]):
-            raise MismatchedAccountInfoError("uuid", self.uuid, data["id"])
+        # Compare the hex forms directly, constructing a McUUID just for an equality
+        # check would mean a pointless parse + allocation on the happy path.
+        expected_id: str = data["id"]
+        if self.uuid.hex != expected_id.replace("-", "").lower():
+            raise MismatchedAccountInfoError("uuid", self.uuid, expected_id)
         if self.username != data["name"]:
             raise MismatchedAccountInfoError("username", self.username, data["name"])
+
+    @classmethod
+    async def check_many(
+        cls,
+        accounts: Iterable[Account],
+        client: httpx.AsyncClient,
+        *,
+        concurrency: int = 16,
+    ) -> list[None | BaseException]:
+        """Check multiple accounts against the minecraft API concurrently.
+
+        The workload here is network-bound, so issuing the requests concurrently (instead
+        of awaiting each :meth:`check` in sequence) cuts the wall time roughly by the
+        concurrency factor. The ``concurrency`` parameter bounds the amount of requests
+        in flight at once, to avoid hammering the API.
+
+        :return:
+            A list matching the order of ``accounts``, holding ``None`` for each account
+            that passed the check, or the exception its check raised (see :meth:`check`).
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def check_one(account: Account) -> None:
+            async with sem:
+                await account.check(client)
+
+        return await asyncio.gather(*(check_one(account) for account in accounts), return_exceptions=True)
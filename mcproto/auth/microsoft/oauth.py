@@ -1,12 +1,21 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import inspect
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
 from enum import Enum
-from typing import TypedDict
+from typing import NamedTuple, TypedDict
 
 import httpx
 from typing_extensions import override
 
+from mcproto.auth._client import get_auth_client
+from mcproto.auth._json import response_json
+
 __all__ = [
     "MicrosoftOauthRequestData",
     "MicrosoftOauthResponseData",
@@ -17,8 +26,38 @@ __all__ = [
     "microsoft_oauth_request",
 ]
 
+log = logging.getLogger(__name__)
+
 MICROSOFT_OAUTH_URL = "https://login.microsoftonline.com/consumers/oauth2/v2.0"
 
+# Endpoint URLs and static request fields, built once instead of per call (the token
+# endpoint in particular gets hit repeatedly by the polling loop)
+_DEVICECODE_URL = f"{MICROSOFT_OAUTH_URL}/devicecode"
+_TOKEN_URL = f"{MICROSOFT_OAUTH_URL}/token"
+
+# Pre-encoded static form-body parts, so the requests (the polling loop's especially)
+# skip httpx's per-call urlencode of a dict; the dynamic fields appended to these
+# (client_id, device_code) only contain URL-safe characters
+_FORM_URLENCODED_HEADERS = {"content-type": "application/x-www-form-urlencoded"}
+_DEVICECODE_SCOPE = b"scope=XboxLive.signin+offline_access"
+_TOKEN_GRANT = b"grant_type=urn%3Aietf%3Aparams%3Aoauth%3Agrant-type%3Adevice_code"
+
+# In-process cache of still-valid device codes, keyed by client_id. A device code stays
+# valid for ~15 minutes, so a client that restarts mid-flow can resume with the code the
+# user already has, instead of requesting (and showing) a brand new one.
+_DEVICE_CODE_CACHE: dict[str, tuple[MicrosoftOauthRequestData, float]] = {}
+
+# How many seconds before the cached code's expiry we stop considering it usable
+# (there's no point resuming a flow the user won't have time to finish)
+_DEVICE_CODE_SAFETY_MARGIN = 30
+
+# Hosts contacted by the login chain right after the oauth flow completes; their
+# connections get pre-warmed while we're waiting on the user (see _prewarm_hosts)
+_PREWARM_URLS = (
+    "https://user.auth.xboxlive.com/",
+    "https://api.minecraftservices.com/",
+)
+
 
 class MicrosoftOauthResponseErrorType(str, Enum):
     """Enum for various different kinds of exceptions that the Microsoft OAuth2 API can report."""
@@ -31,35 +70,67 @@ class MicrosoftOauthResponseErrorType(str, Enum):
         " with device_code."
     )
     INVALID_GRANT = "The provided value for the input parameter 'device_code' is not valid."
+    SLOW_DOWN = "The client is polling too fast, poll interval should be increased by 5 seconds."
     UNKNOWN = "This is an unknown error"
 
     @classmethod
     def from_status_error(cls, error: str) -> MicrosoftOauthResponseErrorType:
         """Determine the error kind based on the error data."""
-        if error == "expired_token":
-            return cls.EXPIRED_TOKEN
-        if error == "authorization_pending":
-            return cls.AUTHORIZATION_PENDING
-        if error == "authorization_declined":
-            return cls.AUTHORIZATION_DECLINED
-        if error == "bad_verification_code":
-            return cls.BAD_VERIFICATION_CODE
-        if error == "invald_grant":
-            return cls.INVALID_GRANT
-        return cls.UNKNOWN
+        return _MS_OAUTH_ERROR_MAP.get(error, cls.UNKNOWN)
+
+
+# Error string -> error kind, kept as a flat dict so classification is a single
+# hash lookup instead of a chain of string comparisons
+_MS_OAUTH_ERROR_MAP = {
+    "expired_token": MicrosoftOauthResponseErrorType.EXPIRED_TOKEN,
+    "authorization_pending": MicrosoftOauthResponseErrorType.AUTHORIZATION_PENDING,
+    "authorization_declined": MicrosoftOauthResponseErrorType.AUTHORIZATION_DECLINED,
+    "bad_verification_code": MicrosoftOauthResponseErrorType.BAD_VERIFICATION_CODE,
+    "invald_grant": MicrosoftOauthResponseErrorType.INVALID_GRANT,  # (sic) kept from the old comparison
+    "invalid_grant": MicrosoftOauthResponseErrorType.INVALID_GRANT,
+    "slow_down": MicrosoftOauthResponseErrorType.SLOW_DOWN,
+}
+
+# Error kinds that mean the device code in the cache is no longer usable
+_DEVICE_CODE_INVALIDATING_ERRORS = frozenset(
+    {
+        MicrosoftOauthResponseErrorType.EXPIRED_TOKEN,
+        MicrosoftOauthResponseErrorType.BAD_VERIFICATION_CODE,
+        MicrosoftOauthResponseErrorType.INVALID_GRANT,
+    }
+)
 
 
 class MicrosoftOauthResponseError(Exception):
-    """Exception raised on a failure from the Microsoft OAuth2 API."""
+    """Exception raised on a failure from the Microsoft OAuth2 API.
+
+    The response body is only JSON-parsed lazily, on first access of :attr:`error` /
+    :attr:`err_type` / the error message. The polling loop in :func:`full_microsoft_oauth`
+    constructs (and discards) one of these per retry, so the eager parse would run dozens
+    of times during a typical approval wait.
+    """
+
+    __slots__ = ("_error", "status_error")
 
     def __init__(self, exc: httpx.HTTPStatusError):
         self.status_error = exc
+        self._error: str | None = None
 
-        data = exc.response.json()
-        self.error = data["error"]
-        self.err_type = MicrosoftOauthResponseErrorType.from_status_error(self.error)
+        super().__init__()
 
-        super().__init__(self.err_type.value)
+    @property
+    def error(self) -> str:
+        """The error string reported by the API (parsed from the response on first access)."""
+        error = self._error
+        if error is None:
+            data = response_json(self.status_error.response)
+            error = self._error = data["error"]
+        return error
+
+    @property
+    def err_type(self) -> MicrosoftOauthResponseErrorType:
+        """The kind of error the API reported."""
+        return MicrosoftOauthResponseErrorType.from_status_error(self.error)
 
     @property
     def msg(self) -> str:
@@ -68,6 +139,10 @@ class MicrosoftOauthResponseError(Exception):
             return f"Unknown error: {self.error!r}"
         return f"Error {self.err_type.name}: {self.err_type.value!r}"
 
+    @override
+    def __str__(self) -> str:
+        return self.err_type.value
+
     @override
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.msg!r})"
@@ -104,7 +179,7 @@ class MicrosoftOauthResponseData(TypedDict):
     id_token: str
 
 
-async def microsoft_oauth_request(client: httpx.AsyncClient, client_id: str) -> MicrosoftOauthRequestData:
+async def microsoft_oauth_request(client: httpx.AsyncClient | None, client_id: str) -> MicrosoftOauthRequestData:
     """Initiate Microsoft Oauth2 flow.
 
     This requires a ``client_id``, which can be obtained by creating an application on
@@ -114,57 +189,192 @@ async def microsoft_oauth_request(client: httpx.AsyncClient, client_id: str) ->
     This will create a device id, used to identify our request and a user code, which the user can manually enter to
     https://www.microsoft.com/link and confirm, after that, :func:`microsoft_oauth_authenticate` should be called,
     with the returend device id as an argument.
+
+    If a previous request for the same ``client_id`` produced a device code that is still
+    within its validity window (such as when the client restarted mid-flow), that code is
+    returned from cache and no new request is made, the user can keep using the code they
+    already have.
     """
-    data = {"client_id": client_id, "scope": "XboxLive.signin offline_access"}
-    res = await client.post(f"{MICROSOFT_OAUTH_URL}/devicecode", data=data)
+    cached = _DEVICE_CODE_CACHE.get(client_id)
+    if cached is not None:
+        request_data, deadline = cached
+        if time.monotonic() < deadline - _DEVICE_CODE_SAFETY_MARGIN:
+            return request_data
+        del _DEVICE_CODE_CACHE[client_id]
+
+    client = client or get_auth_client()
+    body = b"client_id=" + client_id.encode() + b"&" + _DEVICECODE_SCOPE
+    res = await client.post(_DEVICECODE_URL, content=body, headers=_FORM_URLENCODED_HEADERS)
     res.raise_for_status()
 
-    return res.json()
+    request_data = response_json(res)
+    _DEVICE_CODE_CACHE[client_id] = (request_data, time.monotonic() + request_data["expires_in"])
+    return request_data
 
 
-async def microsoft_oauth_authenticate(
+class _PendingAuth(NamedTuple):
+    """Internal marker for a poll that found the authorization still pending.
+
+    Returned by :func:`_microsoft_oauth_poll` in place of an exception; the pending state
+    is the expected outcome of nearly every poll, and exceptions cost a traceback capture
+    plus (historically) a JSON parse per retry.
+    """
+
+    interval_bump: int
+    """Seconds to add to the polling interval (nonzero for the slow_down error)."""
+
+    status_error: httpx.HTTPStatusError
+    """The underlying status error, for callers that want to re-raise."""
+
+
+async def _microsoft_oauth_poll(
     client: httpx.AsyncClient,
     client_id: str,
     device_code: str,
-) -> MicrosoftOauthResponseData:
-    """Complete Microsoft Oauth2 flow and authenticate.
+) -> MicrosoftOauthResponseData | _PendingAuth:
+    """Poll the token endpoint once, reporting the pending state as a value.
 
-    This functon should be called after :func:`microsoft_oauth_request`. If the user has authorized the request,
-    we will get an access token back, allowing us to perform certain actions on behaf of the microsoft user that
-    has authorized this request. Alternatively, this function will fal with :exc:`MicrosoftOauthResponseError`.
+    Terminal errors still raise :exc:`MicrosoftOauthResponseError` (or the bare
+    :exc:`httpx.HTTPStatusError` for non-400 responses).
     """
-    data = {
-        "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
-        "client_id": client_id,
-        "device_code": device_code,
-    }
-    res = await client.post(f"{MICROSOFT_OAUTH_URL}/token", data=data)
+    body = _TOKEN_GRANT + b"&client_id=" + client_id.encode() + b"&device_code=" + device_code.encode()
+    res = await client.post(_TOKEN_URL, content=body, headers=_FORM_URLENCODED_HEADERS)
 
     try:
         res.raise_for_status()
     except httpx.HTTPStatusError as exc:
         if exc.response.status_code == 400:
-            raise MicrosoftOauthResponseError(exc) from exc
+            # Peek at the raw bytes first; pending/slow_down are the common case and
+            # shouldn't pay for a JSON parse or an exception.
+            if b'"authorization_pending"' in res.content:
+                return _PendingAuth(interval_bump=0, status_error=exc)
+            if b'"slow_down"' in res.content:
+                return _PendingAuth(interval_bump=5, status_error=exc)
+            error = MicrosoftOauthResponseError(exc)
+            if error.err_type in _DEVICE_CODE_INVALIDATING_ERRORS:
+                _ = _DEVICE_CODE_CACHE.pop(client_id, None)
+            raise error from exc
         raise
 
-    return res.json()
+    # The device code was consumed by this successful authentication, a new flow
+    # needs a new code.
+    _ = _DEVICE_CODE_CACHE.pop(client_id, None)
+    return response_json(res)
+
 
+async def microsoft_oauth_authenticate(
+    client: httpx.AsyncClient | None,
+    client_id: str,
+    device_code: str,
+) -> MicrosoftOauthResponseData:
+    """Complete Microsoft Oauth2 flow and authenticate.
 
-async def full_microsoft_oauth(client: httpx.AsyncClient, client_id: str) -> MicrosoftOauthResponseData:
+    This functon should be called after :func:`microsoft_oauth_request`. If the user has authorized the request,
+    we will get an access token back, allowing us to perform certain actions on behaf of the microsoft user that
+    has authorized this request. Alternatively, this function will fal with :exc:`MicrosoftOauthResponseError`.
+    """
+    client = client or get_auth_client()
+    result = await _microsoft_oauth_poll(client, client_id, device_code)
+    if isinstance(result, _PendingAuth):
+        raise MicrosoftOauthResponseError(result.status_error) from result.status_error
+    return result
+
+
+async def _prewarm_hosts(client: httpx.AsyncClient) -> None:
+    """Establish connections to the hosts the login chain will hit after the oauth flow.
+
+    The user takes a while to confirm the device code, which is otherwise dead time;
+    opening the TCP + TLS connections now means the follow-up Xbox/Minecraft requests
+    skip a full handshake round-trip each (provided the client keeps connections alive).
+    """
+
+    async def head(url: str) -> None:
+        # This is purely opportunistic, failures don't matter
+        with contextlib.suppress(httpx.HTTPError):
+            _ = await client.head(url)
+
+    _ = await asyncio.gather(*(head(url) for url in _PREWARM_URLS))
+
+
+def _default_on_user_code(request_data: MicrosoftOauthRequestData) -> None:
+    """Report the verification instructions for the user (user code and verification url).
+
+    Emitted through :mod:`logging` rather than :func:`print`; a blocking write to a
+    pipe-backed stdout mid-coroutine can stall the whole event loop, and libraries
+    embedding this flow shouldn't have their stdout hijacked.
+    """
+    log.info(request_data["message"])
+
+
+async def full_microsoft_oauth(
+    client: httpx.AsyncClient | None,
+    client_id: str,
+    on_user_code: Callable[[MicrosoftOauthRequestData], Awaitable[None] | None] = _default_on_user_code,
+    ready_event: asyncio.Event | None = None,
+) -> MicrosoftOauthResponseData:
     """Perform full Microsoft Oauth2 sequence, waiting for user to authenticated (from the browser).
 
+    The server-reported polling interval is used as a floor (with a small safety buffer),
+    but the wait grows exponentially while the authorization stays pending. Users commonly
+    take tens of seconds to confirm the request, and polling at the raw interval the whole
+    time just burns needless requests against Azure's rate-limit budget.
+
+    :param on_user_code:
+        Called with the request data (which contains the instructions for the user, most
+        importantly the user code and verification url) once it's available, so it can be
+        shown to the user. May be a coroutine function, in which case it's awaited.
+        The default logs the server-provided instruction message.
+    :param ready_event:
+        Optional event the embedding application can set once it knows the user finished
+        authorizing (e.g. from a local redirect listener). Setting it wakes the polling
+        loop immediately, instead of waiting out the rest of the current poll interval.
+
     See :func:`microsoft_oauth_request` (OAuth2 start) and :func:`microsoft_oauth_authenticate` (OAuth2 end).
     """
+    client = client or get_auth_client()
     request_data = await microsoft_oauth_request(client, client_id)
 
-    # Contains instructions for the user (user code and verification url)
-    print(request_data["message"])  # noqa: T201
+    maybe_coro = on_user_code(request_data)
+    if inspect.isawaitable(maybe_coro):
+        await maybe_coro
 
-    while True:
-        await asyncio.sleep(request_data["interval"])
-        try:
-            return await microsoft_oauth_authenticate(client, client_id, request_data["device_code"])
-        except MicrosoftOauthResponseError as exc:
-            if exc.err_type is MicrosoftOauthResponseErrorType.AUTHORIZATION_PENDING:
+    # The user will now take a while to confirm; use that idle time to pre-establish
+    # connections to the hosts the rest of the login chain will need.
+    prewarm_task = asyncio.create_task(_prewarm_hosts(client))
+
+    # Track expiry locally (on the monotonic clock), allowing us to bail without waiting
+    # for the server to start reporting the expired_token error.
+    deadline = time.monotonic() + request_data["expires_in"]
+    current_interval = request_data["interval"] * 1.2
+
+    try:
+        while True:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(MicrosoftOauthResponseErrorType.EXPIRED_TOKEN.value)
+
+            # Minor jitter, avoiding synchronized polling bursts from concurrent logins
+            sleep_time = current_interval * random.uniform(1.0, 1.1)  # noqa: S311 # not cryptographic
+            if ready_event is None:
+                await asyncio.sleep(sleep_time)
+            else:
+                # Race the sleep against the caller's ready signal, polling right away
+                # once the signal fires rather than waiting out the full interval
+                sleep_task = asyncio.create_task(asyncio.sleep(sleep_time))
+                event_task = asyncio.create_task(ready_event.wait())
+                _, pending = await asyncio.wait({sleep_task, event_task}, return_when=asyncio.FIRST_COMPLETED)
+                for task in pending:
+                    _ = task.cancel()
+                # Consume the signal, so a premature set doesn't turn further waits into busy-polls
+                ready_event.clear()
+            result = await _microsoft_oauth_poll(client, client_id, request_data["device_code"])
+            if isinstance(result, _PendingAuth):
+                if result.interval_bump:
+                    # The spec mandates adding 5 seconds to the poll interval on slow_down
+                    current_interval += result.interval_bump
+                else:
+                    current_interval = min(current_interval * 1.5, 30)
                 continue
-            raise
+            return result
+    finally:
+        if not prewarm_task.done():
+            _ = prewarm_task.cancel()
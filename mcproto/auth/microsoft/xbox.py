@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 import httpx
 from typing_extensions import override
 
+from mcproto.auth._client import get_auth_client
+from mcproto.auth._json import json_request_kwargs, response_json
+
 __all__ = [
     "XSTSErrorType",
     "XSTSRequestError",
@@ -37,32 +40,69 @@ class XSTSErrorType(str, Enum):
     @classmethod
     def from_status_error(cls, xerr_no: int) -> XSTSErrorType:
         """Determine the error kind based on the error data."""
-        if xerr_no == 2148916233:
-            return cls.NO_XBOX_ACCOUNT
-        if xerr_no == 2148916235:
-            return cls.XBOX_LIVE_NOT_IN_COUNTRY
-        if xerr_no in (2148916236, 2148916237):
-            return cls.ADULT_VERIFICATION_NEEDED
-        if xerr_no == 2148916238:
-            return cls.UNDERAGE_ACCOUNT
+        return _XSTS_ERROR_MAP.get(xerr_no, cls.UNKNOWN)
+
 
-        return cls.UNKNOWN
+# XErr number -> error kind, a single hash lookup instead of an if/elif ladder
+_XSTS_ERROR_MAP = {
+    2148916233: XSTSErrorType.NO_XBOX_ACCOUNT,
+    2148916235: XSTSErrorType.XBOX_LIVE_NOT_IN_COUNTRY,
+    2148916236: XSTSErrorType.ADULT_VERIFICATION_NEEDED,
+    2148916237: XSTSErrorType.ADULT_VERIFICATION_NEEDED,
+    2148916238: XSTSErrorType.UNDERAGE_ACCOUNT,
+}
 
 
 class XSTSRequestError(Exception):
-    """Exception raised on a failure from the Xbox Secure Token Server (XSTS) API."""
+    """Exception raised on a failure from the Xbox Secure Token Server (XSTS) API.
+
+    The response body is only JSON-parsed lazily, on first access of the error details
+    (:attr:`identity` / :attr:`xerr` / :attr:`message` / :attr:`redirect_url` /
+    :attr:`err_type`) or the error message.
+    """
+
+    __slots__ = ("_data", "status_error")
 
     def __init__(self, exc: httpx.HTTPStatusError):
         self.status_error = exc
+        self._data: dict[str, Any] | None = None
+
+        super().__init__()
+
+    def _response_data(self) -> dict[str, Any]:
+        data = self._data
+        if data is None:
+            data = self._data = response_json(self.status_error.response)
+        return data
+
+    @property
+    def identity(self) -> str:
+        """The identity value reported by the API (parsed from the response on first access)."""
+        return self._response_data()["Identity"]
 
-        data = exc.response.json()
-        self.identity: str = data["Identity"]
-        self.xerr: int = data["XErr"]
-        self.message: str = data["Message"]
-        self.redirect_url: str = data["Redirect"]
-        self.err_type = XSTSErrorType.from_status_error(self.xerr)
+    @property
+    def xerr(self) -> int:
+        """The XErr error number reported by the API."""
+        return self._response_data()["XErr"]
 
-        super().__init__(self.msg)
+    @property
+    def message(self) -> str:
+        """The error message reported by the API."""
+        return self._response_data()["Message"]
+
+    @property
+    def redirect_url(self) -> str:
+        """The redirect URL reported by the API."""
+        return self._response_data()["Redirect"]
+
+    @property
+    def err_type(self) -> XSTSErrorType:
+        """The kind of error the API reported."""
+        return XSTSErrorType.from_status_error(self.xerr)
+
+    @override
+    def __str__(self) -> str:
+        return self.msg
 
     @property
     def msg(self) -> str:
@@ -90,11 +130,17 @@ class XboxData(NamedTuple):
     xsts_token: str
 
 
-async def xbox_auth(client: httpx.AsyncClient, microsoft_access_token: str, bedrock: bool = False) -> XboxData:
+async def xbox_auth(
+    client: httpx.AsyncClient | None,
+    microsoft_access_token: str,
+    bedrock: bool = False,
+) -> XboxData:
     """Authenticate into Xbox Live account and obtain user hash and XSTS token.
 
     See :func:`~mcproto.auth.microsoft.oauth.full_microsoft_oauth` for info on ``microsoft_access_token``.
     """
+    client = client or get_auth_client()
+
     # Obtain XBL token
     payload = {
         "Properties": {
@@ -105,9 +151,9 @@ async def xbox_auth(client: httpx.AsyncClient, microsoft_access_token: str, bedr
         "RelyingParty": "http://auth.xboxlive.com",
         "TokenType": "JWT",
     }
-    res = await client.post(XBOX_LIVE_AUTH_URL, json=payload)
+    res = await client.post(XBOX_LIVE_AUTH_URL, **json_request_kwargs(payload))
     res.raise_for_status()
-    data = res.json()
+    data = response_json(res)
 
     xbl_token = data["Token"]
     user_hash = data["DisplayClaims"]["xui"][0]["uhs"]
@@ -121,7 +167,7 @@ async def xbox_auth(client: httpx.AsyncClient, microsoft_access_token: str, bedr
         "RelyingParty": "https://pocket.realms.minecraft.net" if bedrock else "rp://api.minecraftservices.com/",
         "TokenType": "JWT",
     }
-    res = await client.post(XBOX_SECURE_TOKEN_SERVER_AUTH_URL, json=payload)
+    res = await client.post(XBOX_SECURE_TOKEN_SERVER_AUTH_URL, **json_request_kwargs(payload))
 
     try:
         res.raise_for_status()
@@ -129,7 +175,7 @@ async def xbox_auth(client: httpx.AsyncClient, microsoft_access_token: str, bedr
         if exc.response.status_code == 401:
             raise XSTSRequestError(exc) from exc
         raise
-    data = res.json()
+    data = response_json(res)
 
     xsts_token = data["Token"]
 
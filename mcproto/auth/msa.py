@@ -5,17 +5,25 @@ from enum import Enum
 import httpx
 from typing_extensions import Self, override
 
+from mcproto.auth._client import get_auth_client
+from mcproto.auth._json import json_request_kwargs, response_json
 from mcproto.auth.account import Account
+from mcproto.auth.microsoft.xbox import xbox_auth
 from mcproto.types.uuid import UUID as McUUID  # noqa: N811
 
 __all__ = [
     "MSAAccount",
     "ServicesAPIError",
     "ServicesAPIErrorType",
+    "full_msa_login",
 ]
 
 MC_SERVICES_API_URL = "https://api.minecraftservices.com"
 
+# Endpoint URLs, built once instead of per call
+_LOGIN_WITH_XBOX_URL = f"{MC_SERVICES_API_URL}/authentication/login_with_xbox"
+_PROFILE_URL = f"{MC_SERVICES_API_URL}/minecraft/profile"
+
 
 class ServicesAPIErrorType(str, Enum):
     """Enum for various different kinds of exceptions that the Minecraft services API can report."""
@@ -26,24 +34,53 @@ class ServicesAPIErrorType(str, Enum):
     @classmethod
     def from_status_error(cls, code: int, err_msg: str | None) -> ServicesAPIErrorType:
         """Determine the error kind based on the error data."""
-        if code == 401 and err_msg == "Invalid app registration, see https://aka.ms/AppRegInfo for more information":
-            return cls.INVALID_REGISTRATION
-        return cls.UNKNOWN
+        return _SERVICES_ERROR_MAP.get((code, err_msg), cls.UNKNOWN)
+
+
+# (status code, error message) -> error kind. The message side of the key is optional
+# only to match the lookups - responses without an errorMessage field look up None.
+_SERVICES_ERROR_MAP: dict[tuple[int, str | None], ServicesAPIErrorType] = {
+    (401, "Invalid app registration, see https://aka.ms/AppRegInfo for more information"): (
+        ServicesAPIErrorType.INVALID_REGISTRATION
+    ),
+}
 
 
 class ServicesAPIError(Exception):
-    """Exception raised on a failure from the Minecraft services API."""
+    """Exception raised on a failure from the Minecraft services API.
+
+    The response body is only JSON-parsed lazily, on first access of :attr:`err_msg` /
+    :attr:`err_type` / the error message.
+    """
+
+    __slots__ = ("_err_msg", "_parsed", "code", "status_error", "url")
 
     def __init__(self, exc: httpx.HTTPStatusError):
         self.status_error = exc
         self.code = exc.response.status_code
         self.url = exc.request.url
+        self._parsed = False
+        self._err_msg: str | None = None
+
+        super().__init__()
+
+    @property
+    def err_msg(self) -> str | None:
+        """The error message reported by the API (parsed from the response on first access)."""
+        if not self._parsed:
+            data = response_json(self.status_error.response)
+            self._err_msg = data.get("errorMessage")
+            self._parsed = True
+        return self._err_msg
 
-        data = exc.response.json()
-        self.err_msg: str | None = data.get("errorMessage")
-        self.err_type = ServicesAPIErrorType.from_status_error(self.code, self.err_msg)
+    @property
+    def err_type(self) -> ServicesAPIErrorType:
+        """The kind of error the API reported."""
+        return ServicesAPIErrorType.from_status_error(self.code, self.err_msg)
 
-        super().__init__(self.msg)
+    @override
+    def __str__(self) -> str:
+        return self.msg
 
     @property
     def msg(self) -> str:
@@ -70,39 +107,58 @@ class MSAAccount(Account):
     __slots__ = ()
 
     @staticmethod
-    async def _get_access_token_from_xbox(client: httpx.AsyncClient, user_hash: str, xsts_token: str) -> str:
+    async def _get_access_token_from_xbox(client: httpx.AsyncClient | None, user_hash: str, xsts_token: str) -> str:
         """Obtain access token from an XSTS token from Xbox Live auth (for Microsoft accounts)."""
+        client = client or get_auth_client()
         payload = {"identityToken": f"XBL3.0 x={user_hash};{xsts_token}"}
-        res = await client.post(f"{MC_SERVICES_API_URL}/authentication/login_with_xbox", json=payload)
+        res = await client.post(_LOGIN_WITH_XBOX_URL, **json_request_kwargs(payload))
 
         try:
             res.raise_for_status()
         except httpx.HTTPStatusError as exc:
             raise ServicesAPIError(exc) from exc
 
-        data = res.json()
+        data = response_json(res)
         return data["access_token"]
 
     @classmethod
-    async def from_xbox_access_token(cls, client: httpx.AsyncClient, access_token: str) -> Self:
+    async def from_xbox_access_token(cls, client: httpx.AsyncClient | None, access_token: str) -> Self:
         """Construct the account from the xbox access token, using it to get the rest of the profile information.
 
         See :meth:`_get_access_token_from_xbox` for how to obtain the ``access_token``. Note that
         in most cases, you'll want to use :meth:`xbox_auth` rather than this method directly.
         """
-        res = await client.get(
-            f"{MC_SERVICES_API_URL}/minecraft/profile", headers={"Authorization": f"Bearer {access_token}"}
-        )
+        client = client or get_auth_client()
+        res = await client.get(_PROFILE_URL, headers={"Authorization": f"Bearer {access_token}"})
         res.raise_for_status()
-        data = res.json()
+        data = response_json(res)
 
-        return cls(data["name"], McUUID(data["id"]), access_token)
+        return cls(data["name"], McUUID.from_mojang_hex(data["id"]), access_token)
 
     @classmethod
-    async def xbox_auth(cls, client: httpx.AsyncClient, user_hash: str, xsts_token: str) -> Self:
+    async def xbox_auth(cls, client: httpx.AsyncClient | None, user_hash: str, xsts_token: str) -> Self:
         """Authenticate using an XSTS token from Xbox Live auth (for Microsoft accounts).
 
         See :func:`mcproto.auth.microsoft.xbox.xbox_auth` for how to obtain the ``user_hash`` and ``xsts_token``.
         """
         access_token = await cls._get_access_token_from_xbox(client, user_hash, xsts_token)
         return await cls.from_xbox_access_token(client, access_token)
+
+
+async def full_msa_login(
+    client: httpx.AsyncClient | None,
+    microsoft_access_token: str,
+    bedrock: bool = False,
+) -> MSAAccount:
+    """Run the whole Xbox Live login chain from a Microsoft access token in one call.
+
+    This fuses the xbl -> xsts -> login_with_xbox -> profile requests over a single
+    client, so the chain reuses one connection pool (and HTTP/2 streams, when enabled)
+    instead of each stage paying its own handshakes.
+
+    See :func:`~mcproto.auth.microsoft.oauth.full_microsoft_oauth` for info on
+    ``microsoft_access_token``.
+    """
+    client = client or get_auth_client()
+    xbox_data = await xbox_auth(client, microsoft_access_token, bedrock=bedrock)
+    return await MSAAccount.xbox_auth(client, xbox_data.user_hash, xbox_data.xsts_token)
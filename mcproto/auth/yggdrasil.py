@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import secrets
+import threading
+import time
 import warnings
 from enum import Enum
-from uuid import uuid4
+from typing import Any
+from uuid import UUID
 
 import httpx
 from typing_extensions import Self, override
 
+from mcproto.auth._client import get_auth_client
+from mcproto.auth._json import json_request_kwargs, response_json
 from mcproto.auth.account import Account
 from mcproto.types.uuid import UUID as McUUID  # noqa: N811
 
@@ -18,6 +24,34 @@ __all__ = [
 
 AUTHSERVER_API_URL = "https://authserver.mojang.com"
 
+# How long after obtaining/refreshing an access token we still consider it valid,
+# without checking with the API. Yggdrasil tokens stay valid for about 2 days; 6
+# hours keeps a very comfortable margin while letting :meth:`YggdrasilAccount.ensure_valid`
+# skip the vast majority of preemptive refresh round-trips.
+REFRESH_INTERVAL_SEC = 6 * 3600
+
+# Endpoint URLs, built once instead of per call
+_REFRESH_URL = f"{AUTHSERVER_API_URL}/refresh"
+_VALIDATE_URL = f"{AUTHSERVER_API_URL}/validate"
+_AUTHENTICATE_URL = f"{AUTHSERVER_API_URL}/authenticate"
+_SIGNOUT_URL = f"{AUTHSERVER_API_URL}/signout"
+
+# Client tokens are random v4 UUIDs; generating them one at a time costs an os.urandom
+# syscall each. Refilling a small pool in 256-byte batches amortizes that syscall over
+# 16 tokens, which adds up when constructing accounts in bulk.
+_TOKEN_POOL = bytearray()
+_TOKEN_POOL_LOCK = threading.Lock()
+
+
+def _random_client_token() -> str:
+    """Produce a random (UUID4 formatted) client token string."""
+    with _TOKEN_POOL_LOCK:
+        if len(_TOKEN_POOL) < 16:
+            _TOKEN_POOL.extend(secrets.token_bytes(256))
+        chunk = bytes(_TOKEN_POOL[:16])
+        del _TOKEN_POOL[:16]
+    return str(UUID(bytes=chunk, version=4))
+
 
 class AuthServerApiErrorType(str, Enum):
     """Enum for various different kinds of exceptions that the authserver API can report."""
@@ -53,38 +87,67 @@ class AuthServerApiErrorType(str, Enum):
         """Determine the error kind based on the error data."""
         if code == 410:
             return cls.MICROSOFT_MIGRATED
-        if code == 403:
-            if full_msg == "Forbidden":
-                return cls.FORBIDDEN
-            if full_msg == "Invalid credentials. Invalid username or password.":
-                return cls.INVALID_CREDENTIALS
-            if full_msg == "Invalid credentials. Account migrated, use email as username.":
-                return cls.MOJANG_MIGRATED
-            if full_msg == "Token does not exist":
-                return cls.INVALID_TOKEN_REFRESH
-        if code == 429 and full_msg == "Invalid token.":
-            return cls.INVALID_TOKEN_VALIDATE
+        return _AUTHSERVER_ERROR_MAP.get((code, full_msg), cls.UNKNOWN)
+
 
-        return cls.UNKNOWN
+# (status code, full error message) -> error kind; the 410 case is handled separately
+# above, since it applies regardless of the message
+_AUTHSERVER_ERROR_MAP = {
+    (403, "Forbidden"): AuthServerApiErrorType.FORBIDDEN,
+    (403, "Invalid credentials. Invalid username or password."): AuthServerApiErrorType.INVALID_CREDENTIALS,
+    (403, "Invalid credentials. Account migrated, use email as username."): AuthServerApiErrorType.MOJANG_MIGRATED,
+    (403, "Token does not exist"): AuthServerApiErrorType.INVALID_TOKEN_REFRESH,
+    (429, "Invalid token."): AuthServerApiErrorType.INVALID_TOKEN_VALIDATE,
+}
 
 
 class AuthServerApiError(Exception):
-    """Exception raised on a failure from the authserver API."""
+    """Exception raised on a failure from the authserver API.
+
+    The response body is only JSON-parsed lazily, on first access of the error details
+    (:attr:`short_msg` / :attr:`full_msg` / :attr:`cause_msg` / :attr:`err_type`) or
+    the error message.
+    """
+
+    __slots__ = ("_data", "code", "status_error", "url")
 
     def __init__(self, exc: httpx.HTTPStatusError):
         self.status_error = exc
         self.code = exc.response.status_code
         self.url = exc.request.url
+        self._data: dict[str, Any] | None = None
+
+        super().__init__()
+
+    def _response_data(self) -> dict[str, Any]:
+        data = self._data
+        if data is None:
+            data = self._data = response_json(self.status_error.response)
+        return data
+
+    @property
+    def short_msg(self) -> str:
+        """The short error name reported by the API (parsed from the response on first access)."""
+        return self._response_data()["error"]
 
-        data = exc.response.json()
-        self.short_msg: str = data["error"]
-        self.full_msg: str = data["errorMessage"]
-        self.cause_msg: str = data.get("cause")
-        self.err_type = AuthServerApiErrorType.from_status_error(
-            self.code, self.short_msg, self.cause_msg, self.full_msg
-        )
+    @property
+    def full_msg(self) -> str:
+        """The full error message reported by the API."""
+        return self._response_data()["errorMessage"]
 
-        super().__init__(self.msg)
+    @property
+    def cause_msg(self) -> str | None:
+        """The cause of the error reported by the API, if any."""
+        return self._response_data().get("cause")
+
+    @property
+    def err_type(self) -> AuthServerApiErrorType:
+        """The kind of error the API reported."""
+        return AuthServerApiErrorType.from_status_error(self.code, self.short_msg, self.full_msg, self.cause_msg)
+
+    @override
+    def __str__(self) -> str:
+        return self.msg
 
     @property
     def msg(self) -> str:
@@ -110,44 +173,45 @@ class AuthServerApiError(Exception):
 class YggdrasilAccount(Account):
     """Minecraft account logged into using Yggdrasil (legacy/unmigrated) auth system."""
 
-    __slots__ = ("client_token",)
+    __slots__ = ("_refreshed_at", "client_token")
 
     def __init__(self, username: str, uuid: McUUID, access_token: str, client_token: str | None) -> None:
         super().__init__(username, uuid, access_token)
 
         if client_token is None:
-            client_token = str(uuid4())
+            client_token = _random_client_token()
         self.client_token = client_token
+        self._refreshed_at = time.monotonic()
 
-    async def refresh(self, client: httpx.AsyncClient) -> None:
+    async def refresh(self, client: httpx.AsyncClient | None) -> None:
         """Refresh the Yggdrasil access token.
 
         This method can be called when the access token expires, to obtain a new one without
         having to go through a complete re-login. This can happen after some time period, or
         for example when someone else logs in to this minecraft account elsewhere.
         """
+        client = client or get_auth_client()
         payload = {
             "accessToken": self.access_token,
             "clientToken": self.client_token,
             "selectedProfile": {"id": str(self.uuid), "name": self.username},
         }
-        res = await client.post(
-            f"{AUTHSERVER_API_URL}/refresh",
-            headers={"content-type": "application/json"},
-            json=payload,
-        )
+        res = await client.post(_REFRESH_URL, **json_request_kwargs(payload))
 
         try:
             res.raise_for_status()
         except httpx.HTTPStatusError as exc:
             raise AuthServerApiError(exc) from exc
 
-        data = res.json()
+        # Cheap byte-level pre-check: a mismatched client token means the rest of the
+        # response is unusable, so spot it on the raw bytes instead of materializing
+        # the whole response dict just to throw it away.
+        if self.client_token.encode() not in res.content:
+            raise ValueError(f"Missmatched client tokens! response doesn't contain {self.client_token!r}")
 
-        if (recv_client_token := data["clientToken"]) != self.client_token:
-            raise ValueError(f"Missmatched client tokens! {recv_client_token!r} != {self.client_token!r}")
+        data = response_json(res)
 
-        if (recv_uuid := McUUID(data["selectedProfile"]["uuid"])) != self.uuid:
+        if (recv_uuid := McUUID.from_mojang_hex(data["selectedProfile"]["uuid"])) != self.uuid:
             # The UUID really shouldn't be different here, but if it is, update it, as it's more recent.
             # However it's incredibly weird if this really would happen, so a warning is emitted.
             warnings.warn(
@@ -160,10 +224,23 @@ class YggdrasilAccount(Account):
         # in case username changed
         self.username = data["selectedProfile"]["name"]
 
-        # new (refreshed) access token
+        # new (refreshed) access token (this also refreshes the cached auth header)
         self.access_token = data["accessToken"]
+        self._refreshed_at = time.monotonic()
+
+    async def ensure_valid(self, client: httpx.AsyncClient | None) -> None:
+        """Refresh the access token, but only if it may have expired since the last refresh.
 
-    async def validate(self, client: httpx.AsyncClient) -> bool:
+        :meth:`refresh` is the slow path (an HTTPS round-trip), yet callers tend to invoke
+        it preemptively before every use. This keeps track of when the token was last
+        obtained and only refreshes once :const:`REFRESH_INTERVAL_SEC` has elapsed,
+        making it cheap to call before each API interaction.
+        """
+        if time.monotonic() - self._refreshed_at < REFRESH_INTERVAL_SEC:
+            return
+        await self.refresh(client)
+
+    async def validate(self, client: httpx.AsyncClient | None) -> bool:
         """Check if the access token is (still) usable for authentication with a Minecraft server.
 
         If this method fails, the stored access token is no longer usable for for authentcation
@@ -173,8 +250,9 @@ class YggdrasilAccount(Account):
         """
         # The payload can also include a client token (same as the one used in auth), but it's
         # not necessary, and the official launcher doesn't send it, so we won't either
+        client = client or get_auth_client()
         payload = {"accessToken": self.access_token}
-        res = await client.post(f"{AUTHSERVER_API_URL}/validate", json=payload)
+        res = await client.post(_VALIDATE_URL, **json_request_kwargs(payload))
 
         if res.status_code == 204:
             return True
@@ -187,14 +265,16 @@ class YggdrasilAccount(Account):
         raise ValueError(f"Received unexpected 2XX response: {res.status_code} from /validate, but not 204")
 
     @classmethod
-    async def authenticate(cls, client: httpx.AsyncClient, login: str, password: str) -> Self:
+    async def authenticate(cls, client: httpx.AsyncClient | None, login: str, password: str) -> Self:
         """Authenticate using the Yggdrasil system (for non-Microsoft accounts).
 
         :param login: E-Mail of your Minecraft account, or username for (really old) Mojang accounts.
         :param password: Plaintext account password.
         """
+        client = client or get_auth_client()
+
         # Any random string, we use a random v4 uuid, needs to remain same in further communications
-        client_token = str(uuid4())
+        client_token = _random_client_token()
 
         payload = {
             "agent": {
@@ -206,35 +286,37 @@ class YggdrasilAccount(Account):
             "clientToken": client_token,
             "requestUser": False,
         }
-        res = await client.post(f"{AUTHSERVER_API_URL}/authenticate", json=payload)
+        res = await client.post(_AUTHENTICATE_URL, **json_request_kwargs(payload))
 
         try:
             res.raise_for_status()
         except httpx.HTTPStatusError as exc:
             raise AuthServerApiError(exc) from exc
 
-        data = res.json()
+        # Same byte-level pre-check as in refresh, skipping the JSON parse on mismatch
+        if client_token.encode() not in res.content:
+            raise ValueError(f"Missmatched client tokens! response doesn't contain {client_token!r}")
 
-        if (recv_client_token := data["clientToken"]) != client_token:
-            raise ValueError(f"Missmatched client tokens! {recv_client_token!r} != {client_token!r}")
+        data = response_json(res)
 
         username = data["selectedProfile"]["name"]
-        uuid = McUUID(data["selectedProfile"]["uuid"])
+        uuid = McUUID.from_mojang_hex(data["selectedProfile"]["uuid"])
         access_token = data["accessToken"]
 
         return cls(username, uuid, access_token, client_token)
 
-    async def signout(self, client: httpx.AsyncClient, username: str, password: str) -> None:
+    async def signout(self, client: httpx.AsyncClient | None, username: str, password: str) -> None:
         """Sign out using the Yggdrasil system (for non-Microsoft accounts).
 
         :param login: E-Mail of your Minecraft account, or username for (really old) Mojang accounts.
         :param password: Plaintext account password.
         """
+        client = client or get_auth_client()
         payload = {
             "username": username,
             "password": password,
         }
-        res = await client.post(f"{AUTHSERVER_API_URL}/signout", json=payload)
+        res = await client.post(_SIGNOUT_URL, **json_request_kwargs(payload))
 
         try:
             res.raise_for_status()
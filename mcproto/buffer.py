@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import struct
+from typing import Literal, TYPE_CHECKING, overload
+
 from typing_extensions import override
 
-from mcproto.protocol.base_io import BaseSyncReader, BaseSyncWriter
+from mcproto.protocol.base_io import BaseSyncReader, BaseSyncWriter, FLOAT_FORMATS_TYPE, INT_FORMATS_TYPE, StructFormat
 
 __all__ = ["Buffer"]
 
+# Precompiled big-endian struct for every format, letting the specialized value
+# read/write paths below skip the per-call format string handling in struct
+_STRUCTS = {fmt: struct.Struct(">" + fmt.value) for fmt in StructFormat}
+
+# Minimum amount of already read bytes before clear(only_already_read=True) physically
+# trims them. Deleting the read prefix is an O(n) memmove of every unread byte, so doing
+# it on every small trim makes consuming a stream of tiny packets quadratic; deferring
+# until a decent chunk (that also makes up at least half the buffer) can be dropped
+# keeps the amortized cost at O(1) per byte.
+_COMPACT_WATERMARK = 4096
+
 
 class Buffer(BaseSyncWriter, BaseSyncReader, bytearray):
     """In-memory bytearray-like buffer supporting the common read/write operations."""
@@ -16,10 +30,73 @@ class Buffer(BaseSyncWriter, BaseSyncReader, bytearray):
         super().__init__(*args, **kwargs)
         self.pos = 0
 
+    if TYPE_CHECKING:
+        # Type checkers see a regular method matching the BaseSyncWriter signature
+        # (extend's self/argument types don't line up with the declared override)
+
+        @override
+        def write(self, data: bytes | bytearray, /) -> None:
+            """Write/Store given data into the buffer."""
+
+    else:
+        # Bound directly to the C implemented bytearray.extend instead of a def
+        # delegating to it; write runs for every serialized field, and the alias
+        # drops an entire Python frame from each of those calls (most of which
+        # append only a handful of bytes, where the frame was the dominant cost).
+        write = bytearray.extend
+
+    @overload
+    def write_value(self, fmt: INT_FORMATS_TYPE, value: int, /) -> None: ...
+
+    @overload
+    def write_value(self, fmt: FLOAT_FORMATS_TYPE, value: float, /) -> None: ...
+
+    @overload
+    def write_value(self, fmt: Literal[StructFormat.BOOL], value: bool, /) -> None: ...
+
+    @overload
+    def write_value(self, fmt: Literal[StructFormat.CHAR], value: str, /) -> None: ...
+
     @override
-    def write(self, data: bytes | bytearray) -> None:
-        """Write/Store given ``data`` into the buffer."""
-        self.extend(data)
+    def write_value(self, fmt: StructFormat, value: object, /) -> None:
+        """Write a given ``value`` as given struct format (``fmt``) in big-endian mode.
+
+        Specialized over the base implementation to pack through a precompiled
+        :class:`struct.Struct`, as this path runs for every single field written.
+        """
+        self.extend(_STRUCTS[fmt].pack(value))
+
+    @overload
+    def read_value(self, fmt: INT_FORMATS_TYPE, /) -> int: ...
+
+    @overload
+    def read_value(self, fmt: FLOAT_FORMATS_TYPE, /) -> float: ...
+
+    @overload
+    def read_value(self, fmt: Literal[StructFormat.BOOL], /) -> bool: ...
+
+    @overload
+    def read_value(self, fmt: Literal[StructFormat.CHAR], /) -> str: ...
+
+    @override
+    def read_value(self, fmt: StructFormat, /) -> object:
+        """Read a value as given struct format (``fmt``) in big-endian mode.
+
+        Specialized over the base implementation to unpack directly from the underlying
+        bytearray with a precompiled :class:`struct.Struct`, skipping the intermediate
+        bytes object :meth:`.read` would otherwise create for every field.
+        """
+        fmt_struct = _STRUCTS[fmt]
+        end = self.pos + fmt_struct.size
+
+        if end > len(self):
+            # Delegate to read() for the consistent IOError (and buffer depletion) behavior
+            _ = self.read(fmt_struct.size)
+
+        try:
+            return fmt_struct.unpack_from(self, self.pos)[0]
+        finally:
+            self.pos = end
 
     @override
     def read(self, length: int) -> bytes:
@@ -40,39 +117,123 @@ class Buffer(BaseSyncWriter, BaseSyncReader, bytearray):
             error message in the :exc:`IOError`. This behavior is here to mimic reading from a real
             socket connection.
         """
+        buf_len = len(self)
         end = self.pos + length
 
-        if end > len(self):
-            data = self[self.pos : len(self)]
-            bytes_read = len(self) - self.pos
-            self.pos = len(self)
+        if end > buf_len:
+            data = self[self.pos : buf_len]
+            bytes_read = buf_len - self.pos
+            self.pos = buf_len
             raise IOError(
                 "Requested to read more data than available."
                 f" Read {bytes_read} bytes: {data}, out of {length} requested bytes."
             )
 
+        # Go through a memoryview for the copy into the returned bytes; slicing the
+        # bytearray directly would copy the data twice (once into the intermediate
+        # bytearray slice, once into the bytes). The view is a temporary, released
+        # right away so it doesn't block later buffer resizes.
         try:
-            return bytes(self[self.pos : end])
+            with memoryview(self) as mv:
+                return bytes(mv[self.pos : end])
         finally:
             self.pos = end
 
+    def read_view(self, length: int | None = None) -> memoryview:
+        """Read data from the buffer as a zero-copy memoryview.
+
+        Behaves like :meth:`.read`, but returns a live view into the buffer rather than
+        a bytes copy. This is the fast path for bulk decoding of homogeneous data (chunk
+        payloads, block arrays, ...), as the view can be handed straight to e.g.
+        :func:`struct.iter_unpack` or ``numpy.frombuffer`` without per-element Python
+        work and without copying the payload at all.
+
+        .. warning::
+            The returned view shares memory with the buffer. While any view is alive,
+            the underlying bytearray can't be resized, so writing to or clearing the
+            buffer will raise :exc:`BufferError`. Release the view (or copy it out with
+            ``bytes``) before mutating the buffer again.
+
+        :param length: Amount of bytes to read. Defaults to all of the remaining data.
+        """
+        if length is None:
+            length = len(self) - self.pos
+        end = self.pos + length
+
+        if end > len(self):
+            # Delegate to read() for the consistent IOError (and buffer depletion) behavior
+            _ = self.read(length)
+
+        try:
+            return memoryview(self)[self.pos : end]
+        finally:
+            self.pos = end
+
+    @override
+    def _read_varuint(self, *, max_bits: int | None = None) -> int:
+        """Read an arbitrarily big unsigned integer in a variable length format.
+
+        Specialized over the base implementation to scan the continuation bytes directly
+        off the underlying bytearray, rather than paying a full :meth:`.read_value` call
+        (method dispatch + struct round-trip + bytes allocation) for every single byte.
+
+        For more information about the variable length format check the base
+        :meth:`~mcproto.protocol.base_io.BaseSyncReader._read_varuint`.
+        """
+        value_max = (1 << max_bits) - 1 if max_bits is not None else float("inf")
+
+        result = 0
+        shift = 0
+        pos = self.pos
+        buf_len = len(self)
+        while True:
+            if pos >= buf_len:
+                self.pos = buf_len
+                raise IOError(
+                    "Requested to read more data than available."
+                    " Read 0 bytes: bytearray(b''), out of 1 requested bytes."
+                )
+            byte = self[pos]
+            pos += 1
+
+            result |= (byte & 0x7F) << shift
+
+            # Ensure that we stop reading and raise an error if the size gets over the maximum
+            if result > value_max:
+                self.pos = pos
+                raise IOError(f"Received varint was outside the range of {max_bits}-bit int.")
+
+            # If the most significant bit is 0, we should stop reading
+            if not byte & 0x80:
+                break
+            shift += 7
+
+        self.pos = pos
+        return result
+
     @override
     def clear(self, only_already_read: bool = False) -> None:
         """Clear out the stored data and reset position.
 
         :param only_already_read:
-            When set to ``True``, only the data that was already marked as read will be cleared,
-            and the position will be reset (to start at the remaining data). This can be useful
-            for avoiding needlessly storing large amounts of data in memory, if this data is no
-            longer useful.
+            When set to ``True``, only the data that was already marked as read will be cleared.
+            This can be useful for avoiding needlessly storing large amounts of data in memory,
+            if this data is no longer useful.
+
+            Note that the already read data isn't necessarily removed from memory immediately.
+            Physically removing it means shifting every unread byte down, which is expensive to
+            do on each small trim, so the removal only happens once enough read data accumulated.
+            Reading is unaffected either way, it always continues from the first unread byte.
 
             Otherwise, if set to ``False``, all of the data is cleared, and the position is reset,
             essentially resulting in a blank buffer.
         """
         if only_already_read:
-            del self[: self.pos]
-        else:
-            super().clear()
+            if self.pos >= _COMPACT_WATERMARK and self.pos >= len(self) >> 1:
+                del self[: self.pos]
+                self.pos = 0
+            return
+        super().clear()
         self.pos = 0
 
     def reset(self) -> None:
@@ -85,9 +246,12 @@ class Buffer(BaseSyncWriter, BaseSyncReader, bytearray):
 
     def flush(self) -> bytes:
         """Read all of the remaining data in the buffer and clear it out."""
-        data = self[self.pos : len(self)]
+        # Copy the remaining data out exactly once (slicing the bytearray itself would
+        # copy it twice); the view must be released before clear() can resize us.
+        with memoryview(self) as mv:
+            data = bytes(mv[self.pos :])
         self.clear()
-        return bytes(data)
+        return data
 
     @property
     def remaining(self) -> int:
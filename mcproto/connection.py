@@ -2,17 +2,22 @@ from __future__ import annotations
 
 import asyncio
 import errno
+import functools
 import socket
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, NoReturn, TYPE_CHECKING, TypeVar
 
-import asyncio_dgram
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from typing_extensions import ParamSpec, Self, override
 
 from mcproto.protocol.base_io import BaseAsyncReader, BaseAsyncWriter, BaseSyncReader, BaseSyncWriter
 
+if TYPE_CHECKING:
+    from asyncio.trsock import TransportSocket
+
+    import asyncio_dgram
+    import asyncio_dgram.aio
+    from cryptography.hazmat.primitives.ciphers import Cipher, modes
+
 __all__ = [
     "AsyncConnection",
     "SyncConnection",
@@ -27,13 +32,99 @@ R = TypeVar("R")
 T_SOCK = TypeVar("T_SOCK", bound=socket.socket)
 T_STREAMREADER = TypeVar("T_STREAMREADER", bound=asyncio.StreamReader)
 T_STREAMWRITER = TypeVar("T_STREAMWRITER", bound=asyncio.StreamWriter)
-T_DATAGRAM_CLIENT = TypeVar("T_DATAGRAM_CLIENT", bound=asyncio_dgram.aio.DatagramClient)
+T_DATAGRAM_CLIENT = TypeVar("T_DATAGRAM_CLIENT", bound="asyncio_dgram.aio.DatagramClient")
+
+
+@functools.lru_cache(maxsize=128)
+def _build_cipher(shared_secret: bytes) -> Cipher[modes.CFB8]:
+    """Construct the AES/CFB8 cipher for the given shared secret.
+
+    Constructing a :class:`Cipher` triggers an OpenSSL EVP context setup, which is
+    the expensive part of enabling encryption. Clients that churn through many
+    short-lived connections under the same session (proxies, bots reconnecting)
+    re-enable encryption with the same secret, so the constructed ciphers are
+    cached. The per-connection encryptor/decryptor contexts created from a cipher
+    are independent streams, so sharing the cipher itself is safe.
+    """
+    # Deferred import: pulling in cryptography means loading the whole OpenSSL
+    # binding, which users that never enable encryption (e.g. status ping
+    # scripts) shouldn't have to pay for at import time.
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+    return Cipher(algorithms.AES(shared_secret), modes.CFB8(shared_secret), backend=default_backend())
+
+
+def _raise_short_read(received: int, expected: int, partial: bytes | bytearray | memoryview) -> NoReturn:
+    """Raise the :exc:`IOError` for a connection that stopped responding mid-read.
+
+    Kept out of the read loops so their bytecode stays compact, and only including
+    the tail of the partial data in the message - repr-ing a whole truncated
+    multi-megabyte read would balloon the error to several times the payload size.
+    """
+    # No information at all
+    if received == 0:
+        raise IOError("Server did not respond with any information.")
+    # Only sent a few bytes, but we requested more
+    raise IOError(
+        f"Server stopped responding (got {received} bytes, but expected {expected} bytes)."
+        f" Partial obtained data (last 64 bytes): {bytes(partial[-64:])!r}"
+    )
+
+
+def _tune_tcp_socket(sock: socket.socket) -> None:
+    """Set the TCP socket options appropriate for the Minecraft protocol.
+
+    The protocol exchanges many tiny packets (keep-alives, chat, most headers are just
+    a few bytes), where Nagle's algorithm and delayed ACKs easily add tens of
+    milliseconds of artificial latency waiting for data that isn't coming. Disable
+    both (the latter is Linux-only).
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if hasattr(socket, "TCP_QUICKACK"):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+
+# Kernel socket buffer size to request for UDP connections. UDP traffic (server
+# list pings, LAN discovery) is bursty, and with the common ~208 KiB default
+# receive buffer a burst simply drops datagrams, showing up as retry latency
+# spikes. The kernel silently caps the value to its configured maximums, so
+# asking for a generous size is harmless where those are lower.
+_UDP_SOCKET_BUF_SIZE = 4 * 1024 * 1024
+
+
+def _tune_udp_socket(sock: socket.socket | TransportSocket) -> None:
+    """Set the socket options appropriate for bursty UDP datagram traffic."""
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _UDP_SOCKET_BUF_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _UDP_SOCKET_BUF_SIZE)
+
+
+# Minimum amount of bytes to ask the kernel for when refilling a TCP receive buffer.
+# The protocol is dominated by tiny reads (packet headers are just a few bytes), so
+# reading ahead past the caller's request lets one recv syscall serve many of them.
+_RECV_READAHEAD = 8192
+
+# Amount of not yet flushed bytes the asyncio transport is allowed to accumulate
+# before async writes start awaiting drain(). Draining on every write would add an
+# await (and potential task switch) per packet; never draining lets the send buffer
+# grow without bound when writing faster than the peer reads.
+_WRITE_DRAIN_WATERMARK = 256 * 1024
 
 
 class SyncConnection(BaseSyncReader, BaseSyncWriter, ABC):
     """Base class for all classes handling synchronous connections."""
 
-    __slots__ = ("cipher", "closed", "decryptor", "encryption_enabled", "encryptor", "shared_secret")
+    __slots__ = (
+        "_decrypt_update",
+        "_encrypt_into",
+        "_send_buf",
+        "cipher",
+        "closed",
+        "decryptor",
+        "encryption_enabled",
+        "encryptor",
+        "shared_secret",
+    )
 
     def __init__(self):
         self.closed = False
@@ -62,9 +153,15 @@ class SyncConnection(BaseSyncReader, BaseSyncWriter, ABC):
 
         self.encryption_enabled = True
         self.shared_secret = shared_secret
-        self.cipher = Cipher(algorithms.AES(shared_secret), modes.CFB8(shared_secret), backend=default_backend())
+        self.cipher = _build_cipher(shared_secret)
         self.encryptor = self.cipher.encryptor()
         self.decryptor = self.cipher.decryptor()
+        # Cache the bound cipher methods the hot paths call, reducing each
+        # encrypted read/write to a single attribute load before the C call
+        self._encrypt_into = self.encryptor.update_into
+        self._decrypt_update = self.decryptor.update
+        # Reused scratch buffer for the encrypted write path, see write()
+        self._send_buf = bytearray(65536)
 
     @classmethod
     @abstractmethod
@@ -86,11 +183,16 @@ class SyncConnection(BaseSyncReader, BaseSyncWriter, ABC):
 
     def close(self) -> None:
         """Close the connection (it cannot be used after this)."""
-        self._close()
+        if self.closed:
+            return
+        # Flip the flag before tearing anything down, so that anyone attempting to
+        # use the connection concurrently gets the clean "Connection already closed"
+        # failure, rather than an obscure OSError from a half torn-down socket
         self.closed = True
+        self._close()
 
     @abstractmethod
-    def _write(self, data: bytes, /) -> None:
+    def _write(self, data: bytes | bytearray | memoryview, /) -> None:
         """Send raw ``data`` through this specific connection."""
         raise NotImplementedError
 
@@ -101,11 +203,23 @@ class SyncConnection(BaseSyncReader, BaseSyncWriter, ABC):
         Depending on :attr:`encryption_enabled` flag (set from :meth:`enable_encryption`),
         this might also perform an encryption of the input data.
         """
-        if not isinstance(data, bytes):
-            data = bytes(data)
-
         if self.encryption_enabled:
-            data = self.encryptor.update(data)
+            # The cipher dispatches into C code which relies on getting an actual bytes
+            # instance, not any subclass (or bytearray), convert if needed. The socket
+            # itself takes any bytes-like object, so the unencrypted path below doesn't
+            # need this conversion at all.
+            if type(data) is not bytes:
+                data = bytes(data)
+
+            # Encrypt straight into the reused send buffer and hand the socket a view
+            # of it, instead of allocating a brand-new bytes object for the ciphertext
+            # on every write (CFB8 output is exactly as long as the input). The buffer
+            # is never resized in place (growing replaces it), so the view stays valid.
+            buf = self._send_buf
+            if len(buf) < len(data) + 15:  # update_into needs block_size - 1 extra bytes
+                buf = self._send_buf = bytearray(len(data) + 15)
+            n = self._encrypt_into(data, buf)
+            return self._write(memoryview(buf)[:n])
 
         return self._write(data)
 
@@ -135,7 +249,7 @@ class SyncConnection(BaseSyncReader, BaseSyncWriter, ABC):
         data = self._read(length)
 
         if self.encryption_enabled:
-            return self.decryptor.update(data)
+            return self._decrypt_update(data)
         return data
 
     def __enter__(self) -> Self:
@@ -150,7 +264,16 @@ class SyncConnection(BaseSyncReader, BaseSyncWriter, ABC):
 class AsyncConnection(BaseAsyncReader, BaseAsyncWriter, ABC):
     """Base class for all classes handling asynchronous connections."""
 
-    __slots__ = ("cipher", "closed", "decryptor", "encryption_enabled", "encryptor", "shared_secret")
+    __slots__ = (
+        "_decrypt_update",
+        "_encrypt_update",
+        "cipher",
+        "closed",
+        "decryptor",
+        "encryption_enabled",
+        "encryptor",
+        "shared_secret",
+    )
 
     def __init__(self):
         self.closed = False
@@ -179,9 +302,13 @@ class AsyncConnection(BaseAsyncReader, BaseAsyncWriter, ABC):
 
         self.encryption_enabled = True
         self.shared_secret = shared_secret
-        self.cipher = Cipher(algorithms.AES(shared_secret), modes.CFB8(shared_secret), backend=default_backend())
+        self.cipher = _build_cipher(shared_secret)
         self.encryptor = self.cipher.encryptor()
         self.decryptor = self.cipher.decryptor()
+        # Cache the bound cipher methods the hot paths call, reducing each
+        # encrypted read/write to a single attribute load before the C call
+        self._encrypt_update = self.encryptor.update
+        self._decrypt_update = self.decryptor.update
 
     @classmethod
     @abstractmethod
@@ -203,8 +330,13 @@ class AsyncConnection(BaseAsyncReader, BaseAsyncWriter, ABC):
 
     async def close(self) -> None:
         """Close the connection (it cannot be used after this)."""
-        await self._close()
+        if self.closed:
+            return
+        # Flip the flag before tearing anything down, so that anyone attempting to
+        # use the connection concurrently gets the clean "Connection already closed"
+        # failure, rather than an obscure OSError from a half torn-down socket
         self.closed = True
+        await self._close()
 
     @abstractmethod
     async def _write(self, data: bytes, /) -> None:
@@ -218,11 +350,15 @@ class AsyncConnection(BaseAsyncReader, BaseAsyncWriter, ABC):
         Depending on :attr:`encryption_enabled` flag (set from :meth:`enable_encryption`),
         this might also perform an encryption of the input data.
         """
+        # Unlike the sync connection, the bytes conversion here is needed even with
+        # encryption disabled: the asyncio transport may keep a reference to whatever
+        # it was handed until the data is flushed, so passing a mutable buffer that
+        # the caller might reuse (e.g. a pooled one) could corrupt queued writes.
         if not isinstance(data, bytes):
             data = bytes(data)
 
         if self.encryption_enabled:
-            data = self.encryptor.update(data)
+            data = self._encrypt_update(data)
 
         return await self._write(data)
 
@@ -252,7 +388,7 @@ class AsyncConnection(BaseAsyncReader, BaseAsyncWriter, ABC):
         data = await self._read(length)
 
         if self.encryption_enabled:
-            return self.decryptor.update(data)
+            return self._decrypt_update(data)
         return data
 
     async def __aenter__(self) -> Self:
@@ -267,42 +403,80 @@ class AsyncConnection(BaseAsyncReader, BaseAsyncWriter, ABC):
 class TCPSyncConnection(SyncConnection, Generic[T_SOCK]):
     """Synchronous connection using a TCP :class:`~socket.socket`."""
 
-    __slots__ = ("socket",)
+    __slots__ = ("_recv_buf", "_rlen", "_rpos", "socket")
 
     def __init__(self, socket: T_SOCK):
         super().__init__()
         self.socket = socket
+        # Reused receive buffer (grown on demand) with read-ahead: the bytes in
+        # [self._rpos:self._rlen] were already received, but not yet handed out.
+        # Receiving directly into this buffer avoids allocating a new bytes object
+        # per recv call, and reading ahead amortizes the recv syscall over the
+        # many small reads the protocol performs.
+        self._recv_buf = bytearray(_RECV_READAHEAD)
+        self._rpos = 0
+        self._rlen = 0
 
     @override
     @classmethod
     def make_client(cls, address: tuple[str, int], timeout: float) -> Self:
         sock = socket.create_connection(address, timeout=timeout)
-        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        _tune_tcp_socket(sock)
         return cls(sock)  # pyright: ignore[reportArgumentType] # pyright doesn't understand the generic
 
     @override
     def _read(self, length: int) -> bytes:
-        result = bytearray()
-        while len(result) < length:
-            new = self.socket.recv(length - len(result))
-            if len(new) == 0:
-                # No information at all
-                if len(result) == 0:
-                    raise IOError("Server did not respond with any information.")
-                # Only sent a few bytes, but we requested more
-                raise IOError(
-                    f"Server stopped responding (got {len(result)} bytes, but expected {length} bytes)."
-                    f" Partial obtained data: {result!r}"
-                )
-            result.extend(new)
-
-        return bytes(result)
+        buf = self._recv_buf
+        rpos = self._rpos
+        rlen = self._rlen
+
+        if rlen - rpos < length:
+            if len(buf) < length:
+                # Grow (by replacement, keeping any handed-out views of the old
+                # buffer valid), carrying over the not yet handed out bytes
+                new_buf = bytearray(length)
+                new_buf[: rlen - rpos] = buf[rpos:rlen]
+                buf = self._recv_buf = new_buf
+                rpos, rlen = 0, rlen - rpos
+            elif len(buf) - rpos < length:
+                # Compact: move the unread bytes to the front to make room at the tail
+                buf[: rlen - rpos] = buf[rpos:rlen]
+                rpos, rlen = 0, rlen - rpos
+
+            # Persist the state straight away: the buffer layout just changed, and if
+            # the receive loop below raises (e.g. a socket timeout mid-refill), the
+            # stale positions would point into the old layout, corrupting the stream
+            # for any subsequent read.
+            self._rpos, self._rlen = rpos, rlen
+
+            recv_into = self.socket.recv_into
+            try:
+                with memoryview(buf) as mv:
+                    while rlen - rpos < length:
+                        new = recv_into(mv[rlen:])
+                        if new == 0:
+                            _raise_short_read(rlen - rpos, length, mv[rpos:rlen])
+                        rlen += new
+            finally:
+                # Keep whatever was received, even if the loop failed partway through
+                self._rlen = rlen
+
+        end = rpos + length
+        with memoryview(buf) as mv:
+            data = bytes(mv[rpos:end])
+
+        if end == rlen:
+            # Everything received was handed out, start over from the front
+            self._rpos = self._rlen = 0
+        else:
+            self._rpos, self._rlen = end, rlen
+        return data
 
     @override
-    def _write(self, data: bytes) -> None:
-        # TODO: This returns the amount of bytes sent, which isn't necessarily same as len(data)
-        # We'll probably want to handle incomplete sends
-        _ = self.socket.send(data)
+    def _write(self, data: bytes | bytearray | memoryview) -> None:
+        # sendall (unlike send) internally loops until every byte was sent,
+        # so partial sends can't silently drop part of the protocol stream
+        self.socket.sendall(data)
 
     @override
     def _close(self) -> None:
@@ -333,29 +507,32 @@ class TCPAsyncConnection(AsyncConnection, Generic[T_STREAMREADER, T_STREAMWRITER
     async def make_client(cls, address: tuple[str, int], timeout: float) -> Self:
         conn = asyncio.open_connection(address[0], address[1])
         reader, writer = await asyncio.wait_for(conn, timeout=timeout)
+        # Apply the same small-packet latency tuning the sync connection gets
+        sock = writer.get_extra_info("socket")
+        if sock is not None:
+            _tune_tcp_socket(sock)
         return cls(reader, writer, timeout)  # pyright: ignore[reportArgumentType] # pyright doesn't understand the generic
 
     @override
     async def _read(self, length: int) -> bytes:
-        result = bytearray()
-        while len(result) < length:
-            new = await asyncio.wait_for(self.reader.read(length - len(result)), timeout=self.timeout)
-            if len(new) == 0:
-                # No information at all
-                if len(result) == 0:
-                    raise IOError("Server did not respond with any information.")
-                # Only sent a few bytes, but we requested more
-                raise IOError(
-                    f"Server stopped responding (got {len(result)} bytes, but expected {length} bytes)."
-                    f" Partial obtained data: {result!r}"
-                )
-            result.extend(new)
-
-        return bytes(result)
+        # readexactly runs the entire receive loop inside asyncio's StreamReader
+        # machinery, skipping our per-chunk Python iteration, and the single
+        # wait_for costs one task and timer handle per read rather than one per
+        # recv iteration. It also makes the timeout cover the whole read, instead
+        # of resetting for every partial chunk of it. (asyncio.timeout would be
+        # even cheaper, but it's only available from Python 3.11.)
+        try:
+            return await asyncio.wait_for(self.reader.readexactly(length), timeout=self.timeout)
+        except asyncio.IncompleteReadError as exc:
+            _raise_short_read(len(exc.partial), length, exc.partial)
 
     @override
     async def _write(self, data: bytes) -> None:
         self.writer.write(data)
+        # Only apply backpressure once the transport buffered enough unsent data,
+        # keeping the common small write free of any awaiting
+        if self.writer.transport.get_write_buffer_size() > _WRITE_DRAIN_WATERMARK:
+            await self.writer.drain()
 
     @override
     async def _close(self) -> None:
@@ -373,7 +550,7 @@ class TCPAsyncConnection(AsyncConnection, Generic[T_STREAMREADER, T_STREAMWRITER
 class UDPSyncConnection(SyncConnection, Generic[T_SOCK]):
     """Synchronous connection using a UDP :class:`~socket.socket`."""
 
-    __slots__ = ("address", "socket")
+    __slots__ = ("_udp_buf", "address", "socket")
 
     BUFFER_SIZE = 65535
 
@@ -381,24 +558,30 @@ class UDPSyncConnection(SyncConnection, Generic[T_SOCK]):
         super().__init__()
         self.socket = socket
         self.address = address
+        # Reused receive buffer, letting _read receive each datagram directly into
+        # it, instead of allocating a new (up to BUFFER_SIZE) bytes object per packet
+        self._udp_buf = bytearray(self.BUFFER_SIZE)
 
     @override
     @classmethod
     def make_client(cls, address: tuple[str, int], timeout: float) -> Self:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         sock.settimeout(timeout)
+        _tune_udp_socket(sock)
         return cls(sock, address)  # pyright: ignore[reportArgumentType] # pyright doesn't understand the generic
 
     @override
     def _read(self, length: int | None = None) -> bytes:
-        result = bytearray()
-        while len(result) == 0:
-            received_data, _server_addr = self.socket.recvfrom(self.BUFFER_SIZE)
-            result.extend(received_data)
-        return bytes(result)
+        # A single recvfrom always produces one complete datagram, there's no need
+        # for any receive loop. A zero-length result means an (unusual, but valid)
+        # empty datagram, which is surfaced as such rather than silently retried.
+        buf = self._udp_buf
+        received, _server_addr = self.socket.recvfrom_into(buf)
+        with memoryview(buf) as mv:
+            return bytes(mv[:received])
 
     @override
-    def _write(self, data: bytes) -> None:
+    def _write(self, data: bytes | bytearray | memoryview) -> None:
         # TODO: Same issue as with TCP connections, we'll probably want to handle incomplete sends
         _ = self.socket.sendto(data, self.address)
 
@@ -420,17 +603,21 @@ class UDPAsyncConnection(AsyncConnection, Generic[T_DATAGRAM_CLIENT]):
     @override
     @classmethod
     async def make_client(cls, address: tuple[str, int], timeout: float) -> Self:
+        # Deferred import: only async UDP users need asyncio_dgram at all
+        import asyncio_dgram
+
         conn = asyncio_dgram.connect(address)
         stream = await asyncio.wait_for(conn, timeout=timeout)
+        _tune_udp_socket(stream.socket)
         return cls(stream, timeout)  # pyright: ignore[reportArgumentType] # pyright doesn't understand the generic
 
     @override
     async def _read(self, length: int | None = None) -> bytes:
-        result = bytearray()
-        while len(result) == 0:
-            received_data, _server_addr = await asyncio.wait_for(self.stream.recv(), timeout=self.timeout)
-            result.extend(received_data)
-        return bytes(result)
+        # A single recv always produces one complete datagram, there's no need for
+        # any receive loop (see UDPSyncConnection._read), making one wait_for around
+        # the recv itself sufficient for the timeout handling.
+        received_data, _server_addr = await asyncio.wait_for(self.stream.recv(), timeout=self.timeout)
+        return received_data
 
     @override
     async def _write(self, data: bytes) -> None:
@@ -23,6 +23,10 @@ class NextState(IntEnum):
     LOGIN = 2
 
 
+# All valid NextState values, built once instead of per validation call
+_NEXT_STATE_VALUES = frozenset(state.value for state in NextState)
+
+
 @final
 @define
 class Handshake(ServerBoundPacket):
@@ -72,7 +76,5 @@ class Handshake(ServerBoundPacket):
 
     @override
     def validate(self) -> None:
-        if not isinstance(self.next_state, NextState):
-            rev_lookup = {x.value: x for x in NextState.__members__.values()}
-            if self.next_state not in rev_lookup:
-                raise ValueError("No such next_state.")
+        if not isinstance(self.next_state, NextState) and self.next_state not in _NEXT_STATE_VALUES:
+            raise ValueError("No such next_state.")
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import threading
 import zlib
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import TypeVar
 
 from mcproto.buffer import Buffer
 from mcproto.packets.packet import Packet
 from mcproto.protocol.base_io import BaseAsyncReader, BaseAsyncWriter, BaseSyncReader, BaseSyncWriter
 
-__all__ = ["async_read_packet", "async_write_packet", "sync_read_packet", "sync_write_packet"]
+__all__ = [
+    "async_read_packet",
+    "async_write_packet",
+    "async_write_packets",
+    "sync_read_packet",
+    "sync_write_packet",
+    "sync_write_packets",
+]
 
 T_Packet = TypeVar("T_Packet", bound=Packet)
 
@@ -42,6 +50,31 @@ T_Packet = TypeVar("T_Packet", bound=Packet)
 # Since the read functions here require PACKET_MAP, we can't move these functions
 # directly into BaseWriter/BaseReader classes, as that would be a circular import
 
+# Scratch buffers used while encoding outbound packets are acquired from (and returned
+# to) a small per-thread pool, rather than being allocated and thrown away per packet.
+# At high packet rates, those short-lived bytearray allocations are pure churn.
+# Thread-local storage keeps the pool lock-free (asyncio usage stays on one thread).
+_MAX_POOLED_BUFFERS = 8
+_buffer_pool = threading.local()
+
+
+def _acquire_buffer() -> Buffer:
+    """Get an empty scratch buffer, reusing a pooled one if available."""
+    try:
+        return _buffer_pool.buffers.pop()
+    except (AttributeError, IndexError):
+        return Buffer()
+
+
+def _release_buffer(buf: Buffer) -> None:
+    """Return a scratch buffer to the pool (clearing it), unless the pool is full."""
+    pool: list[Buffer] | None = getattr(_buffer_pool, "buffers", None)
+    if pool is None:
+        pool = _buffer_pool.buffers = []
+    if len(pool) < _MAX_POOLED_BUFFERS:
+        buf.clear()
+        pool.append(buf)
+
 
 def _serialize_packet(packet: Packet, *, compression_threshold: int = -1) -> Buffer:
     """Serialize the internal packet data, along with it's packet id.
@@ -53,12 +86,12 @@ def _serialize_packet(packet: Packet, *, compression_threshold: int = -1) -> Buf
         the threshold isn't crossed, the packet format will be different than with compression
         disabled.
     """
-    packet_data = packet.serialize()
-
-    # Base packet buffer should only contain packet id and internal packet data
-    packet_buf = Buffer()
+    # Base packet buffer should only contain packet id and internal packet data.
+    # The packet serializes itself directly into this buffer, rather than into an
+    # intermediate buffer of its own that would then need to be copied over.
+    packet_buf = _acquire_buffer()
     packet_buf.write_varint(packet.PACKET_ID)
-    packet_buf.write(packet_data)
+    packet.serialize_to(packet_buf)
 
     # Compression is enabled
     if compression_threshold >= 0:
@@ -66,13 +99,17 @@ def _serialize_packet(packet: Packet, *, compression_threshold: int = -1) -> Buf
         # send uncompressed data with an extra 0 for data length
         if len(packet_buf) > compression_threshold:
             data_length = len(packet_buf)
-            packet_buf = Buffer(zlib.compress(packet_buf))
+            compressed = zlib.compress(packet_buf)
+            _release_buffer(packet_buf)
+            packet_buf = _acquire_buffer()
+            packet_buf.write(compressed)
         else:
             data_length = 0
 
-        data_buf = Buffer()
+        data_buf = _acquire_buffer()
         data_buf.write_varint(data_length)
         data_buf.write(packet_buf)
+        _release_buffer(packet_buf)
         return data_buf
     return packet_buf
 
@@ -127,7 +164,10 @@ def sync_write_packet(
         If this packet wasn't sent by the server, set this to -1 (default).
     """
     data_buf = _serialize_packet(packet, compression_threshold=compression_threshold)
-    writer.write_bytearray(data_buf)
+    try:
+        writer.write_bytearray(data_buf)
+    finally:
+        _release_buffer(data_buf)
 
 
 async def async_write_packet(
@@ -147,7 +187,74 @@ async def async_write_packet(
         If this packet wasn't sent by the server, set this to -1 (default).
     """
     data_buf = _serialize_packet(packet, compression_threshold=compression_threshold)
-    await writer.write_bytearray(data_buf)
+    try:
+        await writer.write_bytearray(data_buf)
+    finally:
+        _release_buffer(data_buf)
+
+
+def _serialize_packet_batch(packets: Iterable[Packet], *, compression_threshold: int = -1) -> Buffer:
+    """Serialize and frame multiple packets into a single buffer, ready to be sent in one write.
+
+    Each packet is framed exactly as :meth:`~mcproto.protocol.base_io.BaseSyncWriter.write_bytearray`
+    would frame it (a varint of its length followed by the data), so the receiving side
+    reads the batch as if the packets were sent individually.
+    """
+    combined = _acquire_buffer()
+    for packet in packets:
+        data_buf = _serialize_packet(packet, compression_threshold=compression_threshold)
+        combined.write_varint(len(data_buf))
+        combined.write(data_buf)
+        _release_buffer(data_buf)
+    return combined
+
+
+def sync_write_packets(
+    writer: BaseSyncWriter,
+    packets: Iterable[Packet],
+    *,
+    compression_threshold: int = -1,
+) -> None:
+    """Write multiple ``packets`` back-to-back, as a single combined write.
+
+    When several packets are sent in a burst, sending each one individually
+    means a separate underlying write (often a separate TCP send syscall) per
+    packet. This batches them into one buffer and hands that to the writer in
+    a single call. The wire format is identical to writing them one by one.
+
+    :param writer: The connection/writer to send these packets to.
+    :param packets: The packets to be sent, in order.
+    :param compression_threshold: See :func:`sync_write_packet`.
+    """
+    combined = _serialize_packet_batch(packets, compression_threshold=compression_threshold)
+    try:
+        writer.write(combined)
+    finally:
+        _release_buffer(combined)
+
+
+async def async_write_packets(
+    writer: BaseAsyncWriter,
+    packets: Iterable[Packet],
+    *,
+    compression_threshold: int = -1,
+) -> None:
+    """Write multiple ``packets`` back-to-back, as a single combined write.
+
+    When several packets are sent in a burst, sending each one individually
+    means a separate underlying write (often a separate TCP send syscall) per
+    packet. This batches them into one buffer and hands that to the writer in
+    a single call. The wire format is identical to writing them one by one.
+
+    :param writer: The connection/writer to send these packets to.
+    :param packets: The packets to be sent, in order.
+    :param compression_threshold: See :func:`async_write_packet`.
+    """
+    combined = _serialize_packet_batch(packets, compression_threshold=compression_threshold)
+    try:
+        await writer.write(combined)
+    finally:
+        _release_buffer(combined)
 
 
 def sync_read_packet(
@@ -21,6 +21,16 @@ class UUID(uuid.UUID, MCType):
 
     __slots__ = ()
 
+    @classmethod
+    def from_mojang_hex(cls, value: str, /) -> Self:
+        """Construct the UUID from the undashed 32 hex character form used by the Mojang APIs.
+
+        This skips the flexible (dash-stripping, brace-stripping, prefix-handling) string
+        parsing done by the standard constructor, going straight through ``bytes.fromhex``
+        instead, which is noticeably cheaper when loading accounts in bulk.
+        """
+        return cls(bytes=bytes.fromhex(value))
+
     @override
     def serialize_to(self, buf: Buffer) -> None:
         buf.write(self.bytes)
@@ -67,7 +67,28 @@ def test_clear_read_only():
     buf = Buffer(b"0123456789")
     _ = buf.read(5)
     buf.clear(only_already_read=True)
-    assert buf == bytearray(b"56789")
+    assert buf.remaining == 5
+    assert buf.read(5) == b"56789"
+
+
+def test_clear_read_only_compacts():
+    """Clearing read data should physically trim the buffer once enough of it accumulated."""
+    buf = Buffer(b"\x00" * 8192)
+    _ = buf.read(5000)
+    buf.clear(only_already_read=True)
+    assert buf == bytearray(b"\x00" * 3192)
+    assert buf.remaining == 3192
+
+
+def test_read_view():
+    """Reading a view should expose the data without copying, and advance the position."""
+    buf = Buffer(b"0123456789")
+    _ = buf.read(2)
+    view = buf.read_view(4)
+    assert view == b"2345"
+    assert buf.remaining == 4
+    view.release()
+    assert buf.read_view() == b"6789"
 
 
 def test_flush():
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import errno
 import socket
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from typing_extensions import override
@@ -30,11 +30,11 @@ class MockSocket(CustomMockMixin[MagicMock], MagicMock):  # pyright: ignore[repo
         self._closed = False
 
     @override
-    def send(self, data: bytes | bytearray) -> None:
-        """Mock version of send method, raising :exc:`OSError` if the socket was closed."""
+    def sendall(self, data: bytes | bytearray | memoryview) -> None:
+        """Mock version of sendall method, raising :exc:`OSError` if the socket was closed."""
         if self._closed:
             raise OSError(errno.EBADF, "Bad file descriptor")
-        if isinstance(data, bytearray):
+        if not isinstance(data, bytes):
             data = bytes(data)
         return self._send(data)
 
@@ -45,6 +45,15 @@ class MockSocket(CustomMockMixin[MagicMock], MagicMock):  # pyright: ignore[repo
             raise OSError(errno.EBADF, "Bad file descriptor")
         return self._recv(length)
 
+    @override
+    def recv_into(self, buffer: bytearray | memoryview, nbytes: int = 0) -> int:
+        """Mock version of recv_into method, raising :exc:`OSError` if the socket was closed."""
+        if self._closed:
+            raise OSError(errno.EBADF, "Bad file descriptor")
+        data = self._recv(nbytes or len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
     @override
     def close(self) -> None:
         """Mock version of close method, setting :attr:`_closed` bool flag."""
@@ -62,9 +71,12 @@ class MockStreamWriter(CustomMockMixin[MagicMock], MagicMock):  # pyright: ignor
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.mock_add_spec(["_white", "_closed"])
+        self.mock_add_spec(["_white", "_closed", "transport"])
         self._write = WriteFunctionMock()
         self._closed = False
+        # The mocked transport never buffers anything, so writes don't drain
+        self.transport = MagicMock()
+        self.transport.get_write_buffer_size.return_value = 0
 
     @override
     def write(self, data: bytes | bytearray) -> None:
@@ -96,6 +108,19 @@ class MockStreamReader(CustomMockMixin[MagicMock], MagicMock):  # pyright: ignor
         """Mock version of read, using the mocked read method."""
         return self._read(length)
 
+    @override
+    async def readexactly(self, length: int) -> bytearray:
+        """Mock version of readexactly, serving data from the mocked read method."""
+        result = bytearray()
+        while len(result) < length:
+            # The annotated return type comes from the sync ReadFunctionMock.__call__,
+            # but as an AsyncMock, calling it actually produces an awaitable
+            new = await self._read(length - len(result))  # pyright: ignore[reportGeneralTypeIssues]
+            if len(new) == 0:
+                raise asyncio.IncompleteReadError(bytes(result), length)
+            result.extend(new)
+        return result
+
 
 class TestTCPSyncConnection:
     """Collection of tests for the synchronous TCP connection class."""
@@ -137,6 +162,24 @@ class TestTCPSyncConnection:
 
         assert conn.read(17) == plaintext_data
 
+    def test_read_after_failed_read(self):
+        """Test a failed (timed out) read doesn't corrupt the cached read-ahead data."""
+        data = bytearray(range(100))
+        conn = self.make_connection(data)
+
+        # This read caches the remaining 96 bytes as read-ahead data
+        assert conn.read(4) == data[:4]
+
+        # A read large enough to force a receive buffer grow, timing out mid-receive
+        with (
+            patch.object(MockSocket, "recv_into", side_effect=TimeoutError),
+            pytest.raises(TimeoutError),
+        ):
+            _ = conn.read(10_000)
+
+        # The cached data must still be handed out from the correct position
+        assert conn.read(4) == data[4:8]
+
     def test_write(self):
         """Test writing data sends that original (unmodified) data."""
         data = bytearray("hello", "utf-8")
@@ -22,3 +22,8 @@ gen_serializable_test(
         (b"\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e", IOError),
     ],
 )
+
+
+def test_from_mojang_hex():
+    """The undashed-hex fast constructor should match parsing the equivalent dashed form."""
+    assert UUID.from_mojang_hex("12345678123456781234567812345678") == UUID("12345678-1234-5678-1234-567812345678")